@@ -0,0 +1,7 @@
+"""The accepted word list compiled to one contiguous
+5-byte-per-word blob.
+
+Generated by WordleAid.compile_word_list_module from
+accepted_words.txt; regenerate rather than editing."""
+
+WORDS_BLOB = b'aahedaaliiaapasaarghaartiabacaabaciabacsabaftabahtabakaabampabandabashabaskabayaabbasabbedabbesabceeabeamabearabeatabeerabeleabengabersabetsabeysabiesabiusabjadabjudablerablesabletablowabmhoabnetabohmaboilabomaaboonabordaboreabornabramabrayabrimabrinabrisabseyabsitabunaabuneaburaaburnabutsabuzzabyesabysmacaisacaraacariaccasacchaaccoyaccraacedyaceneacerbacersacetaacharachedacherachesacheyachooacidsacidyaciesacingaciniackeeackeracmesacmicacnedacnesacockacoelacoldaconeacralacredacresacronacrosacrylactasactedactinactonactusacylsadatsadawnadawsadaysadbotaddasaddaxaddedadderaddinaddioaddleaddraadeadadeemadhanadhocadieuadiosaditsadlibadmanadmenadmixadnexadoboadoonadorbadownadozeadradadrawadredadretadripadsumadukiaduncadustadvewadvtsadytaadytsadzedadzesaeciaaedesaegeraegisaeonsaerieaerosaesiraevumafaldafancafaraafarsafearafflyafionafizzaflajaflapaflowafoamaforeafretafritafrosaftosagalsagamaagamiagamyagarsagaspagastagatyagaveagazeagbasageneagersaggagaggeraggieaggriaggroaggryaghasagidiagilaagiosagismagistagitaagleeagletagleyaglooaglusagmasagogeagogoagoneagonsagoodagoraagriaagrinagrosagrumaguedaguesagueyagunaagushagutiaheapahentahighahindahingahintaholdaholeahullahuruaidasaidedaidesaidoiaidosaieryaigasaightailedaimagaimakaimedaimeraineeaingaaioliairedairerairnsairthairtsaitchaitusaiveraixesaiyahaiyeeaiyohaiyooaizleajiesajivaajugaajupaajwanakaraakeesakelaakeneakingakitaakkasakkerakoiaakojaakoyaaksedaksesalaapalackalalaalamoalandalanealangalansalantalapaalapsalaryalataalatealaysalbasalbeealbidalceaalcesalcidalcosaldeaalderaldolaleakaleckalecsaleemalefsaleftalephalewsaleyealfasalgalalgasalgidalginalgoralgosalgumaliasalickalifsalimsalinealiosalistaliyaalkiealkinalkosalkydalkylallanalleeallelallenallerallinallisallodallusallylalmahalmasalmehalmesalmudalmugalodsaloedaloesalohaaloinaloosalosealowealthoaltosalulaalumsalumyalurealurkalvaralwayamahsamainamariamaroamateamautambanambitambosambryamebaameerameneamensamentamiasamiceamiciamideamidoamidsamiesamigaamigoamineaminoaminsamirsamlasammanammasammonammosamniaamnicamnioamoksamoleamoreamortamouramoveamowtampedampulamritamuckamylsananaanataanchoancleanconandicandroanearaneleanentangasangloanighanileanilsanimaanimianionaniseankerankhsankusanlasannalannanannasannatannumannusanoasanoleanomyansaeansasantaeantarantasantedantesantisantraantreantsyanuraanyonapaceapageapaidapaydapaysapeakapeekapersapertaperyapgaraphisapianapiolapishapismapodeapodsapolsapoopaportappalappamappayappelapproapptsappuiappuyapresapsesapsisapsosaptedapteraquaeaquasarabaaraksarameararsarbaharbasarcedarchiarcosarcusardebardriareadareaearealarearareasarecaareddaredearefyareicarenearepaarerearetearetsarettargalarganargilargleargolargonargotargusarhatariasarielarikiarilsariotarisharitharkedarledarlesarmedarmerarmetarmilarnasarnisarnutarobaarohaaroidarpasarpenarraharrasarretarrisarrozarsedarsesarseyarsisartalartelarterarticartisartlyaruhearumsarvalarveearvosarylsasadaasanaasconascusasdicashedashesashetasityaskaraskedaskeraskoiaskosaspenasperaspicaspieaspisasproassaiassamassedassesassezassotasterastirastunasuraaswayaswimasylaatapsataxyatigiatiltatimyatlasatmanatmasatmosatocsatokeatoksatomsatomyatonyatopyatriaatripattapattarattasatteratuasauchtaudadaudaxaugenaugeraugesaughtaulasaulicauloiaulosaumilaunesauntsauraeauralauraraurasaureiauresauricaurisaurumautosauxinavaleavantavastavelsavensaversavgasavineavionaviseavisoavizeavowsavyzeawariawarnawatoawaveawaysawdlsaweelawetoawingawkinawmryawnedawnerawolsaworkaxelsaxileaxilsaxingaxiteaxledaxlesaxmanaxmenaxoidaxoneaxonsayahsayayaayelpaygreayinsaymagayontayresayrieazansazideazidoazineazlonazoicazoleazonsazoteazothazukiazurnazuryazygyazymeazymsbaaedbaalsbaapsbabasbabbybabelbabesbabkababoobabulbabusbaccabaccobaccybachabachsbacksbackybacnebadambaddybaelsbaffsbaffybaftabaftsbaghsbagiebagsybaguabahtsbahusbahutbaiksbailebailsbairnbaisabaithbaitsbaizabaizebajanbajrabajribajusbakedbakenbakesbakrabalasbaldsbaldybaledbalesbalksbalkyballoballsballybalmsbaloibalonbaloobalotbalsabaltibalunbalusbalutbamasbambibammabammybanakbancobancsbandabandhbandsbandybanedbanesbangsbaniabanksbankybannsbantsbantubantybantzbanyabaonsbaozibappubapusbarbebarbsbarbybarcabardebardobardsbardybaredbarerbaresbarfibarfsbarfybaricbarksbarkybarmsbarmybarnsbarnybarpsbarrabarrebarrobarrybaryebasanbasasbasedbasenbaserbasesbashabashobasijbasksbasonbassebassibassobassybastabastibastobastsbatedbatesbathsbatikbatosbattabattsbattubaudsbauksbaulkbaursbavinbawdsbawksbawlsbawnsbawrsbawtybayasbayedbayerbayesbaylebaytsbazarbazasbazoobballbdaysbeadsbeaksbeakybealsbeamsbeamybeanobeansbeanybearebearsbeathbeatsbeatybeausbeautbeauxbebopbecapbeckebecksbedadbedelbedesbedewbedimbedyebeedibeefsbeepsbeersbeerybeetsbefogbegadbegarbegembegobbegotbegumbeigebeigybeinsbeirabeisabekahbelahbelarbelaybeleebelgabelitbellibellobellsbelonbeltsbelvebemadbemasbemixbemudbendsbendybenesbenetbengabenisbenjibennebennibennybentobentsbentybepatberayberesbergsberkoberksbermebermsberobberylbesatbesawbeseebesesbesitbesombesotbestibestsbetasbetedbetesbethsbetidbetonbettabettybevanbeverbevorbevuebevvybewdybewetbewigbezesbezilbezzybhaisbhajibhangbhatsbhavabhelsbhootbhunabhutsbiachbialibialybibbsbibesbibisbiccybicesbickybidedbiderbidesbidetbidisbidonbidribieldbiersbiffobiffsbiffybifidbigaebiggsbiggybighabightbiglybigosbihonbijoubikedbikerbikesbikiebikkybilalbilatbilbobilbybiledbilesbilgybilksbillsbimahbimasbimbobinalbindibindsbinerbinesbingsbingybinitbinksbinkybintsbiogsbionsbiontbiosebiotabipedbipodbippybirdobirdsbirisbirksbirlebirlsbirosbirrsbirsebirsybirzebirzzbisesbisksbisombitchbiterbitesbiteybitosbitoubitsybittebittsbiviabivvybizesbizzobizzyblabsbladsbladyblaerblaesblaffblagsblahsblainblamsblancblartblaseblashblateblatsblattblaudblawnblawsblaysbleahblearblebsblechbleesblentblertblestbletsbleysblimyblingbliniblinsblinyblipsblistbliteblitsbliveblobsblocsblogsblonxblookbloopbloreblotsblowsblowyblubsbludebludsbludybluedbluesbluetblueybluidblumeblunkblursblypeboabsboaksboarsboartboatsboatybobacbobakbobasbobolbobosboccabocceboccibochebocksbodedbodesbodgebodgybodhibodlebodohboepsboersboetiboetsboeufboffoboffsboganbogeyboggybogiebogleboguebogusboheabohosboilsboingboinkboitebokedbokehbokesbokosbolarbolasboldoboldsbolesboletbolixbolksbollsbolosboltsbolusbomasbombebombobombsbomohbomorboncebondsbonedbonerbonesbongsboniebonksbonnebonnybonumbonzabonzebooaibooayboobsboodybooedboofyboogyboohsbooksbookyboolsboomsboomyboongboonsboordboorsboosebootsboppyborakboralborasbordebordsboredboreeborekborelborerboresborgoboricborksbormsbornaboronbortsbortybortzboseybosiebosksboskybosonbossabosunbotasbotehbotelbotesbotewbothybotosbottebottsbottybougebouksboultbounsbourdbourgbournbousebousyboutsboutubovidbowatbowedbowerbowesbowetbowiebowlsbownebowrsbowseboxedboxenboxesboxlaboxtyboyarboyauboyedboyeyboyfsboygsboylaboylyboyosboysybozosbraaibrachbrackbractbradsbraesbragsbrahsbrailbraksbrakybramebranebrankbransbrantbrastbratsbravabravibrawsbraxybraysbrazabrazebreambredebredsbreembreerbreesbreidbreisbremebrensbrentbrerebrersbrevebrewsbreysbrierbriesbrigsbrikibriksbrillbrimsbrinsbriosbrisebrissbrithbritsbrittbrizebrochbrockbrodsbroghbrogsbromebromobroncbrondbroolbroosbrosebrosybrowsbruckbrughbruhsbruinbruitbrujabrujobrulebrumebrungbruskbrustbrutsbruvsbuatsbuazebubalbubasbubbabubbebubbybubusbuchubuckobucksbuckubudasbudedbudesbudisbudosbuenabuffabuffebuffibuffobuffsbuffybufosbuftybuganbuhlsbuhrsbuiksbuistbukesbukosbulbsbulgybulksbullabullsbulsebumbobumfsbumphbumpsbumpybunasbuncebuncobundebundhbundsbundtbundubundybungsbungybuniabunjebunjybunkobunksbunnsbuntsbuntybunyabuoysbuppyburanburasburbsburdsburetburfiburghburgsburinburkaburkeburksburlsburnsburooburpsburqaburraburroburrsburrybursabursebusbybusesbusksbuskybussubustibustsbustybuteobutesbutlebutohbuttsbuttybututbutylbuyinbuzzybwanabwazibydedbydesbykedbykesbyresbyrlsbyssibytesbywaycaaedcabascabercabobcaboccabrecacascackscackycadeecadescadgecadgycadiecadiscadrecaecacaesecafescaffecaffscagedcagercagescagotcahowcaidscainscairdcajoncajuncakedcakescakeycalfscalidcalifcalixcalkscallacallecallscalmscalmycaloscalpacalpscalvecalyxcamancamascamescamiscamoscampicampocampscampycamuscandocanedcanehcanercanescangscanidcannacannscansocanstcanticantocantscantycapascapaxcapedcapescapexcaphscapizcaplecaponcaposcapotcapricapulcarapcarbocarbscarbycardicardscardycaredcarercarescaretcarexcarkscarlecarlscarnecarnscarnycarobcaromcaroncarpecarpicarpscarrscarsecartacartecartscarvycasascascocasedcasercasescaskscaskycastscasuscatescaudacaukscauldcaulscaumscaupscauricausacavascavedcavelcavercavescaviecavuscawedcawkscaxonceazecebidcecalcecumcededcedercedescedisceibaceiliceilscelebcellacellicellscellycelomceltscensecentocentscentuceorlcepescerciceredcerescergeceriacericcernecerocceroscertscertycessecestacesticetescetylcezvechaapchaatchacechackchacochadochadschaftchaischalschamschanachangchankchapechapschaptcharacharecharkcharrcharscharychatschavachavechavschawkchawlchawschayachayschebachedicheebcheepcheetchefschekachelachelpchemochemscherechertchethchevychewschewychiaochiaschibachibschicachichchicochicschielchikochikschilechimbchimochimpchinechingchinkchinochinschipschirkchirlchirmchirochirrchirtchiruchitichitschivachivechivschivychizzchocochocschodechogschoilchokochokycholacholicholochompchonschoofchookchoomchoonchopschosschotachottchoutchouxchowkchowschubschufachuffchugschumschurlchurrchusechutschylechymechyndcibolcidedcidescielsciggyciliacillscimarcimexcinctcinescinqscionscippicircscirescirlscirriciscocissycistscitalcitedciteecitercitescivescivetciviecivvyclachcladecladsclaesclagsclairclameclamsclansclapsclaptclaroclartclaryclastclatsclautclaveclaviclawsclayscleckcleekcleepclefsclegscleikclemsclepecleptcleveclewscliedcliescliftclimeclineclintclipeclipscliptclitscloamclodscloffclogsclokeclombclompclonkclonscloopclootclopscloteclotsclourclousclowscloyecloysclozeclubscluesclueyclunkclypecnidacoactcoadycoalacoalscoalycoaptcoarbcoatecoaticoatscobbscobbycobiacoblecobotcobzacocascoccicoccocockscockycocoscocuscodascodeccodedcodencodercodescodexcodoncoedscoffscogiecogoncoguecohabcohencohoecohogcohoscoifscoigncoilscoinscoirscoitscokedcokescokeycolascolbycoldscoledcolescoleycoliccolincollecollscollycologcoltscolzacomaecomalcomascombecombicombocombscombycomercomescomixcommecommocommscommycompocompscomptcomtecomusconedconesconexconeyconfscongacongecongoconiaconinconksconkyconneconnscontecontoconusconvocoochcooedcooeecooercooeycoofscookscookycoolscoolycoombcoomscoomycoonscoopscooptcoostcootscootycoozecopalcopaycopedcopencopercopescophacoppycopracopsycoquicoramcorbecorbycordacordscoredcorescoreycorgicoriacorkscorkycormscornicornocornscornucorpscorsecorsocoseccosedcosescosetcoseycosiecostacostecostscotancotchcotedcotescothscottacottscoudecoupscourbcourdcourecourscoutacouthcovedcovescovincowalcowancowedcowkscowlscowpscowrycoxaecoxalcoxedcoxescoxibcoyaucoyedcoyercoypucozedcozencozescozeycoziecraalcrabscragscraiccraigcrakecramecramscranscrapecrapscrapycrarecrawscrayscredscreelcreescreincremacremscrenacrepscrepycrewecrewscriascribocribscriescrimscrinecrinkcrinscrioscripecripscrisecrisscrithcritscrocicrocscroftcrogscrombcromecronkcronscroolcrooncropscrorecrostcroutcrowlcrowscrozecruckcrudocrudscrudycruescruetcruftcrunkcruorcruracrusecrusycruvecrwthcryercrynectenecubbycubebcubedcubercubescubitcuckscuddacuddycuecacuffocuffscuifscuingcuishcuitscukesculchculetculexcullscullyculmsculpaculticultscultycumeccundycuneicunitcunnycuntscupelcupidcuppacuppycuprocuratcurbscurchcurdscurdycuredcurercurescuretcurfscuriacuriecurlicurlscurnscurnycurrscursicurstcuseccushycuskscuspscuspycussocusumcutchcutercutescuteycutincutiscuttocuttycutupcuveecuzescwtchcyanocyanscycadcycascyclocydercylixcymaecymarcymascymescymolcystscytescytonczarsdaalsdabbadacesdachadacksdadahdadasdadisdadladadosdaffsdaffydaggadaggydagosdahisdahlsdaikodainedaintdakerdaleddalekdalesdalisdalledaltsdamandamardamesdammedamnadamnsdampsdampydancydandadangsdaniodanksdannydansedantsdappydarafdarbsdarcydareddarerdaresdargadargsdaricdarisdarksdarkydarlsdarnsdarredartsdarzidashidashydataldateddaterdatesdatildatosdattodaubedaubsdaubydaudsdaultdaursdautsdavendavitdawahdawdsdaweddawendawgsdawksdawnsdawtsdayaldayandaychdayntdazeddazerdazesdbagsdeadsdeairdealsdeansdearedearndearsdearydeashdeavedeawsdeawydebagdebbydebeldebesdebtsdebuddeburdebusdebyedecaddecafdecandecimdeckodecksdecosdecyldedaldeedsdeedydeelydeemsdeensdeepsdeeredeersdeetsdeevedeevsdefatdeffodefisdefogdegasdegumdegusdeicedeidsdeifydeilsdeinkdeismdeistdekeddekesdekkodeleddelesdelfsdelftdelisdelladellsdellydelosdelphdeltsdemandemesdemicdemitdemobdemoidemosdemotdemptdenardenaydenchdenesdenetdenisdentedentsdeochdeoxyderatderayderedderesderigdermadermsdernsdernyderosderpyderroderryderthdervsdesexdeshidesisdesksdessedetagdevasdeveldevisdevondevosdevotdewandewardewaxdeweddexesdexiedexysdhabadhaksdhalsdhikrdhobidholedholldholsdhonidhotidhowsdhutidiactdialsdianadianediazodibbsdiceddicerdicesdichtdicksdickydicotdictadictodictsdictudictydiddydidiedidisdidosdidstdiebsdielsdienedietsdiffsdightdikasdikeddikerdikesdikeydildodillidillsdimbodimerdimesdimpsdinardineddinesdingedingsdinicdinksdinkydinlodinnadinosdintsdiochdiolsdiotadippydipsodiramdirerdirkedirksdirlsdirtsdisasdiscidiscsdishydisksdismeditalditasditedditesditsydittsditzydivandivasdiveddivesdiveydivisdivnadivosdivotdivvydiwandixiedixitdiyasdizendjinndjinsdoabsdoatsdobbydobesdobiedobladobledobradobrodochtdocksdocosdocusdoddydodosdoeksdoersdoestdoethdoffsdogaldogandogesdogeydoggodoggydogiedoglydohyodoiltdoilydoitsdojosdolcedolcidoleddoleedolesdoleydoliadoliedollsdolmadolordolosdoltsdomaldomeddomesdomicdonahdonasdoneedonerdongadongsdonkodonnadonnedonnydonsydoobsdoocedoodydoofsdooksdookydooledoolsdoolydoomsdoomydoonadoorndoorsdoozydopasdopeddoperdopesdoppedoraddorbadorbsdoreedoresdoricdorisdorjedorksdorkydormsdormydorpsdorrsdorsadorsedortsdortydosaidosasdoseddosehdoserdosesdoshadotaldoteddoterdotesdottydouardoucedoucsdouksdouladoumadoumsdoupsdouradousedoutsdoveddovendoverdovesdoviedowakdowardowdsdoweddowerdowfsdowiedowledowlsdowlydownadownsdowpsdowsedowtsdoxeddoxesdoxiedoyendoylydozeddozerdozesdrabsdrackdracodraffdragsdraildramsdrantdrapsdrapydratsdravedrawsdraysdreardreckdreeddreerdreesdregsdreksdrentdreredrestdreysdribsdricedriesdrilydripsdriptdrockdroiddroildrokedroledromedronydroobdroogdrookdropsdroptdroukdrowsdrubsdrugsdrumsdrupedrusedrusydruxydryaddryasdsobodsomoduadsdualsduansduarsdubbodubbyducalducatducesducksduckyductiductsduddydudeddudesduelsduetsduettduffsdufusduingduitsdukasdukeddukesdukkadukundulcedulesduliadullsdulsedumasdumbodumbsdumkadumkydumpsdunamdunchdunesdungsdungydunksdunnodunnydunshduntsduomiduomodupedduperdupesdupleduplyduppyduraldurasduredduresdurgydurnsdurocdurosduroydurradurrsdurrydurstdurumdurzidusksdustsduxesdwaaldwaledwalmdwamsdwamydwangdwaumdweebdwiledwinedyadsdyersdykeddykesdykeydykondyneldynesdynosdzhoseaglyeagreealedealeseanedeardsearedearlsearnsearntearsteasedeasereaseseasleeastseatheeatineavedeavereavesebankebbedebbetebenaebeneebikeebonsebookecadsecardecashechedechesechosecigsecoleecrusedemaedgededgeredgesedileeditseduceeducteejiteensyeeveneevereevnseffedefferefitsegadsegersegesteggareggedeggeregmasehingeidereidoseigneeikedeikoneildseironeiselejidoekdamekkaselainelandelanselchieldineleetelemielfedeliadelintelmenelogeelogyeloinelopselpeeelsineluteelvanelvenelverelvesemacsembarembayembogembowemboxembusemeeremendemergemeryemeusemicsemirsemitsemmasemmeremmetemmewemmysemojiemongemoteemoveemptsemuleemureemydeemydsenarmenateendedenderendewendueenewsenfixeniacenlitenmewennogenokienolsenormenowsenrolensewenskyentiaentreenureenurnenvoienzymeolideorlseosinepactepeesepenaepeneephahephasephodephorepicsepodeepopteppieeprisequesequiderbiaerevsergonergosergoterhusericaerickericseringernederneseroseerrederseseructerugoeruvservenervilescarescotesileeskareskeresnesesrogessesestocestopestroetageetapeetatsetensethalethneethyleticsetnasetrogettinettleetuisetweeetymaeughseukedeupadeuroseusolevegsevensevertevetsevhoeevilseviteevoheewersewestewhowewkedexamsexeatexecsexeemexemeexfilexierexiesexineexingexiteexitsexodeexomeexonsexpatexposexudeexulsexurbeyasseyerseyotseyraseyreseyrieeyrirezinefabbofabbyfacedfacerfacesfaceyfaciafaciefactafactofactsfactyfaddyfadedfaderfadesfadgefadosfaenafaeryfaffsfaffyfaggyfaginfagotfaiksfailsfainefainsfairefairsfakedfakerfakesfakeyfakiefakirfalajfalesfallsfalsyfamedfamesfanalfandsfanesfangafangofangsfanksfanonfanosfanumfaqirfaradfarcifarcyfardsfaredfarerfaresfarlefarlsfarmsfarosfarrofarsefartsfascifastifastsfatedfatesfatlyfatsofatwafauchfaughfauldfaunsfaurdfautefautsfauvefavasfavelfaverfavesfavusfawnsfawnyfaxedfaxesfayedfayerfaynefayrefazedfazesfealsfeardfearefearsfeartfeasefeatsfeazefecesfechtfecitfecksfedaifedexfeebsfeedsfeelsfeelyfeensfeersfeesefeezefehmefeintfeistfelchfelidfelixfellsfellyfeltsfeltyfemalfemesfemicfemmyfendsfendyfenisfenksfennyfentsfeodsfeofffererferesferiaferlyfermifermsfernsfernyferoxfessefestafestsfestyfetasfetedfetesfetorfettafettsfetwafeuarfeudsfeuedfeyedfeyerfeylyfezesfezzyfiarsfiatsfibrefibroficesfichefichuficinficosfictafidesfidgefidosfidusfiefsfientfierefierifiersfiestfifedfiferfifesfifisfiggyfigosfikedfikesfilarfilchfiledfilesfiliifilksfillefillofillsfilmifilmsfilonfilosfilumfincafindsfinedfinesfinisfinksfinnyfinosfiordfiqhsfiquefiredfirerfiresfiriefirksfirmafirmsfirnifirnsfirryfirthfiscsfishofisksfistsfistyfitchfitlyfitnafittefittsfiverfivesfixedfixesfixiefixitfjeldflabsflaffflagsflaksflammflamsflamyflaneflansflapsflaryflatsflavaflawnflawsflawyflaxyflaysfleamfleasfleekfleerfleesflegsflemefleurflewsflexiflexofleysflicsfliedfliesflimpflimsflipsflirsfliskfliteflitsflittflobsflocsfloesflogsflongflopsfloreflorsfloryfloshflotafloteflowsflowyflubsfluedfluesflueyflukyflumpfluorflurrflutyfluytflybyflyinflypeflytefnarrfoalsfoamsfoehnfogeyfogiefoglefogosfogoufohnsfoidsfoilsfoinsfoldsfoleyfoliafolicfoliefolksfolkyfomesfondafondsfondufonesfoniofonlyfontsfoodsfoodyfoolsfootsfootyforamforbsforbyfordofordsforelforesforexforksforkyformaformeformsfortsforzaforzefossafossefouatfoudsfouerfouetfoulefoulsfountfoursfouthfoveafowlsfowthfoxedfoxesfoxiefoylefoynefrabsfrackfractfragsfraimfraisfrancfrapefrapsfrassfratefratifratsfrausfraysfreesfreetfreitfremdfrenafreonfrerefretsfribsfrierfriesfrigsfrisefristfritafritefrithfritsfrittfrizefrizzfroesfrogsfrommfronsfroomfrorefrornfroryfroshfrowsfrowyfroyofrugsfrumpfrushfrustfryerfubarfubbyfubsyfucksfucusfuddyfudgyfuelsfuerofuffsfuffyfugalfuggyfugiefugiofugisfuglefuglyfugusfujisfullafullsfulthfulwafumedfumerfumesfumetfundafundifundofundsfundyfungofungsfunicfunisfunksfunsyfuntsfuralfuranfurcafurlsfurolfurosfurrsfurthfurzefurzyfusedfuseefuselfusesfusilfusksfustsfustyfutonfuzedfuzeefuzesfuzilfycesfykedfykesfylesfyrdsfyttegabbagabbygablegaddigadesgadgegadgygadidgadisgadjegadjogadsogaffsgagedgagergagesgaidsgainsgairsgaitagaitsgaittgajosgalahgalasgalaxgaleagaledgalesgaliagalisgallsgallygalopgalutgalvogamasgamaygambagambegambogambsgamedgamesgameygamicgamingammegammygampsganchgandyganefganevgangsganjaganksganofgantsgaolsgapedgapergapesgaposgappygaramgarbagarbegarbogarbsgardagardegaresgarisgarmsgarnigarregarrigarthgarumgasesgashygaspsgaspygastsgatchgatedgatergatesgathsgatorgauchgaucygaudsgaujegaultgaumsgaumygaupsgaursgaussgauzygavotgawcygawdsgawksgawpsgawsygayalgazalgazargazedgazesgazongazoogealsgeansgearegearsgeasageatsgeburgecksgeeksgeepsgeestgeistgeitsgeldsgeleegelidgellygeltsgemelgemmagemmygemotgenaegenalgenasgenesgenetgenicgeniigeningeniogenipgennygenoagenomgenrogentsgentygenuagenusgeodegeoidgerahgerbegeresgerlegermsgermygernegessegessogestegestsgetasgetupgeumsgeyangeyerghastghatsghautghazigheesghestghuslghyllgibedgibelgibergibesgibligibusgiftsgigasgighegigotgiguegilasgildsgiletgiliagillsgillygilpygiltsgimelgimmegimpsgimpyginchgingagingegingsginksginnyginzogipongippogippygirdsgirlfgirlsgirnsgirongirosgirrsgirshgirtsgismogismsgistsgitchgitesgiustgivedgivesgizmoglacegladsgladyglaikglairglampglamsglansglaryglattglaumglaurglazyglebaglebeglebygledegledsgleedgleekgleesgleetgleisglensglentgleysglialgliasglibsgliffgliftglikeglimeglimsgliskglitsglitzgloamglobiglobsglobyglodegloggglomsgloopglopsglostgloutglowsglowyglozegluedgluergluesglueygluggglugsglumeglumsgluongluteglutsgnapignarlgnarrgnarsgnatsgnawngnawsgnowsgoadsgoafsgoaftgoalsgoarygoatsgoatygoavegobangobargobbegobbigobbogobbygobisgobosgodetgodsogoelsgoersgoestgoethgoetygofergoffsgoggagogosgoiergojisgokesgoldsgoldygolesgolfsgolpegolpsgombogomergompagonchgonefgongsgoniagonifgonksgonnagonofgonysgonzogoobygoodogoodsgoofsgoogsgooksgookygooldgoolsgoolygoomygoonsgoonygoopsgoopygoorsgoorygoosygopakgopikgoralgorasgoraygorbsgordogoredgoresgorisgormsgormygorpsgorsegorsygoshtgossegotchgothsgothygottagouchgouksgouragoutsgoutygovedgovesgowangowdsgowfsgowksgowlsgownsgoxesgoyimgoylegraalgrabsgradsgraffgraipgramagramegrampgramsgranagranogransgrapygratagratsgravsgraysgrebegrebogrecegreekgreesgregegregogreingrensgrepsgresegrevegrewsgreysgricegridegridsgriffgriftgrigsgrikegrinsgriotgripsgriptgripygrisegristgrisygrithgritsgrizegroatgrodygrogsgroksgromagromsgronegroofgroszgrotsgroufgrovygrowsgrrlsgrrrlgrubsgruedgruesgrufegrumegrumpgrundgrycegrydegrykegrypegryptguacoguanaguanoguansguarsgubbagucksguckygudesguffsgugasgugglguidoguidsguimpguirogulabgulaggulargulasgulesguletgulfsgulfygullsgulphgulpsgulpygummagummigumpsgunasgundigundygungegungygunksgunkygunnyguqingurdygurgegurksgurlsgurlygurnsgurrygurshgurusgushyguslaguslegusligussygustsgutsyguttaguttyguyedguyleguyotguysegwinegyalsgyansgybedgybesgyeldgympsgynaegyniegynnygynosgyozagypesgyposgyppogyppygyralgyredgyresgyrongyrosgyrusgytesgyvedgyvergyveshaafshaarshaatshablehabushacekhackshackyhadalhadedhadeshadjihadsthaemshaerehaetshaffshafizhaftahaftshaggshahamhahashaickhaikahaikshaikuhailshailyhainshainthairshaithhajeshajishajjihakamhakashakeahakeshakimhakushalalhaldihaledhalerhaleshalfahalfshalidhallohallshalmahalmshalonhaloshalsehalshhaltshalvahalwahamalhambahamedhamelhameshammyhamzahanaphancehanchhandihandshangihangshankshankyhansahansehantshaolehaomahapashapaxhaplyhappihapusharamhardsharedharesharimharksharlsharmsharnsharosharpshartshashyhaskshaspshastahatedhateshathahathihattyhaudshaufshaughhaugohauldhaulmhaulshaulthaunshausehavanhavelhaverhaveshawedhawkshawmshawsehayedhayerhayeyhaylehazanhazedhazerhazeshazleheadshealdhealsheameheapsheapyhearehearsheastheatsheatyhebenhebeshechtheckshederhedgyheedsheedyheelsheezehefteheftsheiauheidsheighheilsheirshejabhejraheledhelesheliohellahellshellyhelmsheloshelothelpshelvehemalhemeshemicheminhempshempyhenchhendshengehennahennyhenryhentsheparherbsherbyherdsheresherlshermahermshernsherosherpsherryhersehertzheryehespshestsheteshethsheuchheughheveahevelhewedhewerhewghhexadhexedhexerhexeshexylheyedhianthibashickshidedhiderhideshiemshifishighshighthijabhijrahikedhikerhikeshikoihilarhilchhillohillshilsahiltshilumhilushimbohinauhindshingshinkyhinnyhintshioishipedhiperhipeshiplyhiredhireehirerhireshissyhistshithehivedhiverhiveshizenhoachhoaedhoagyhoarshoaryhoasthoboshockshocushodadhodjahoershoganhogenhoggshoghshogohhogoshohedhoickhoiedhoikshoinghoisehokashokedhokeshokeyhokishokkuhokumholdsholedholesholeyholkshollaholloholmeholmsholonholosholtshomashomedhomeshomeyhomiehommehomoshonanhondahondshonedhonerhoneshongihongshonkshonkyhoochhoodshoodyhooeyhoofshoogohoohahookahookshookyhoolyhoonshoopshoordhoorshooshhootshootyhoovehopakhopedhoperhopeshoppyhorahhoralhorashorishorkshormehornshorsthorsyhosedhoselhosenhoserhoseshoseyhostahostshotchhotenhotishottehottyhouffhoufshoughhourihourshoutshoveahovedhovenhoveshowayhowbehoweshowffhowfshowkshowlshowrehowsohowtohoxedhoxeshoyashoyedhoylehubbahubbyhuckshudnahududhuershuffshuffyhugerhuggyhuhushuiashuieshukouhulashuleshulkshulkyhullohullshullyhumashumfshumichumpshumpyhundohunkshuntshurdshurlshurlyhurrahursthurtshurtyhushyhuskshusoshutiahuzzahuzzyhwylshydelhydrahyenshyggehyinghykeshylashyleghyleshylichymnshyndehyoidhypedhypeshyphahyphyhyposhyraxhysonhytheiambiiambsibrikicersichedichesichoricierickerickleiconsictalicticictusidantiddahiddatiddutideasideesidentidledidlesidlisidolaidolsidylsiftarigapoiggediglusignisihramiiwisikansikatsikonsileacilealileumileusiliadilialiliumillerillthimagoimagyimamsimariimaumimbarimbedimbosimideimidoimidsimineiminoimlisimmewimmitimmiximpedimpisimpotimproimshiimshyinaptinarminbyeincasincelincleincogincusincutindewindiaindieindolindowindriindueinerminfixinfosinfrainganingleinioninkedinkerinkleinnedinnieinnitinorbinrosinruninseeinsetinspointelintilintisintrainulainureinurninustinvarinverinwitiodiciodidiodiniorasiotasipponiradeiridsiringirkedirokoironeironsisbasishesisledislesisnaeisseiistleitemsitheriviediviesixiasixnayixoraixtleizardizarsizzatjaapsjabotjacaljacetjacksjackyjadedjadesjafasjaffajagasjagerjaggsjaggyjagirjagrajailsjakerjakesjakeyjakiejalapjaleojalopjambejambojambsjambujamesjammyjamonjamunjanesjankyjannsjannyjantyjapanjapedjaperjapesjarksjarlsjarpsjartajaruljaseyjaspejaspsjathajatisjatosjauksjaunejaupsjavasjaveljawanjawedjawnsjaxiejeansjeatsjebeljedisjeelsjeelyjeepsjeerajeersjeezejefesjeffsjehadjehusjelabjellojellsjembejemmyjennyjeonsjeridjerksjerryjessejessyjestsjesusjeteejetesjetonjeunejewedjewiejhalajheeljhilsjiaosjibbajibbsjibedjiberjibesjiffsjiggyjigotjihadjillsjiltsjimmyjimpyjingojingsjinksjinnejinnijinnsjirdsjirgajirrejismsjitisjittyjivedjiverjivesjiveyjnanajobedjobesjockojocksjockyjocosjodeljoeysjohnsjoinsjokedjokesjokeyjokoljoledjolesjoliejollojollsjoltsjoltyjomonjomosjonesjongsjontyjooksjoramjortsjorumjotasjottyjotunjoualjougsjouksjoulejoursjowarjowedjowlsjowlyjoyedjubasjubesjucosjudasjudgyjudosjugaljugumjujusjukedjukesjukusjulepjuliajumarjumbyjumpsjuncojunksjunkyjupesjuponjuraljuratjureljuresjurisjustejustsjutesjuttyjuvesjuviekaamakababkabarkabobkachakackskadaikadeskadiskafirkagoskaguskahalkaiakkaidskaieskaifskaikakaikskailskaimskaingkainskajalkakaskakiskalamkalaskaleskalifkaliskalpakaluakamaskameskamikkamiskammekanaekanalkanaskanatkandykanehkaneskangakangskanjikantskanzukaonskapaikapaskaphakaphskapokkapowkapurkapuskaputkaraikaraskaratkareekarezkarkskarnskarookaroskarrikarstkarsykartskarzykashakasmekatalkataskatiskattikaughkaurikaurukaurykavalkavaskawaskawaukawedkaylekayoskaziskazookbarskcalskeakikebarkebobkeckskedgekedgykeechkeefskeekskeelskeemakeenokeenskeepskeetskeevekefirkehuakeirskelepkelimkellskellykelpskelpykeltskeltykembokembskempskemptkempykenafkenchkendokenoskentekentskepiskerbskerelkerfskerkykermakernekernskeroskerrykervekesarkestsketasketchketesketolkevelkevilkexeskeyedkeyerkhadikhadskhafskhanakhanskhaphkhatskhayakhazikhedakheerkhethkhetskhirskhojakhorskhoumkhudskhulakhyalkiaatkiackkiakikiangkiasukibbekibbikibeikibeskiblakickskickykiddokiddykidelkideokidgekiefskierskievekievskightkikaykikeskikoikileykiligkilimkillskilnskiloskilpskiltskiltykimbokimetkinaskindakindskindykineskingskingykininkinkskinoskiorekipahkipaskipeskippakippskipsykirbykirkskirnskirrikisankissykistskitabkitedkiterkiteskithekithskitkekitulkivaskiwisklangklapsklettklickkliegkliksklongkloofklugeklutzknagsknapsknarlknarsknaurknawekneesknellknickknishknitskniveknobsknoopknopsknospknotsknoudknoutknowdknoweknowsknubsknuleknurlknurrknursknutskoanskoapskobankoboskoelskoffskoftakogalkohaskohenkohlskoinekoiwikojiskokamkokaskokerkokrakokumkolaskoloskombikombukonbukondokonkskookskookykoorikopekkophskopjekoppakoraikorankoraskoratkoreskoriskormakoroskorunkoruskoseskotchkotoskotowkourakraalkrabskraftkraiskraitkrangkranskranzkrautkrayskreefkreenkreepkrengkrewekriolkronakronekroonkrubikrumpkrunkksarskubiekudoskuduskudzukufiskugelkuiaskukrikukuskulakkulankulaskulfikumiskumyskunaskundskuriskurrekurtakuruskussokustikutaikutaskutchkutiskutuskuyaskuzuskvasskvellkwaaikwelakwinkkwirlkyackkyakskyangkyarskyatskyboskydstkyleskyliekylinkylixkyloekyndekyndskypeskyriekyteskythekyudolaarflaarilabdalabialabislabnelabralaccylacedlacerlaceslacetlaceylacislackalackslackyladduladdyladedladeeladerladesladoolaerslaevolaganlagarlaggylahallaharlaichlaicslaidelaidslaighlaikalaikslairdlairslairylaithlaitylakedlakerlakeslakhslakinlaksalaldylallslamaslambslambylamedlamerlameslamialammylampslanailanaslanchlandelandslanedlaneslankslantslapaslapinlapislapjelappalappylarchlardslardylareelareslarfslargalargolarislarkslarkylarnslarntlarumlasedlaserlaseslassilassulassylastslatahlatedlatenlatexlathilathslathylatkelatuslauanlauchlaudelaudslaufslaundlauralavallavaslavedlaverlaveslavralavvylawedlawerlawinlawkslawnslawnylawsylaxedlaxerlaxeslaxlylaybylayedlayinlayuplazarlazedlazeslazoslazzilazzoleadsleadyleafsleaksleamsleansleanyleapslearelearslearyleatsleavyleazelebenleccylecheledesledgyledumleearleeksleepsleersleeseleetsleezelefteleftslegerlegesleggeleggolegitlegnolehrslehualeirsleishlemanlemedlemellemeslemmalemmelendsleneslengslenislenoslenselentilentoleonelepaklepidlepraleptaleredlereslerpslesboleseslesoslestsletchlethelettyletupleuchleucoleudsleughlevasleveeleveslevinlevislewislexeslexislezeslezzalezzolezzylianalianeliangliardliarsliartliberliborlibralibrelibrilicetlichilichtlicitlickslidarlidosliefslienslierslieuslieveliferlifeslifeyliftsliganligerliggelignelikedlikerlikeslikinlillslilosliltsliltylimanlimaslimaxlimbalimbilimbslimbylimedlimenlimeslimeylimmalimnslimoslimpalimpslinaclinchlindslindylinedlineslineylingalingslingylininlinkslinkylinnslinnylinoslintslintylinumlinuxlionslipaslipeslipinliposlippyliraslirkslirotlisesliskslislelispslistslitailitaslitedlitemliterliteslitholithslitielitrelivedlivenliveslivorlivreliwaaliwasllanoloachloadsloafsloamsloansloastloavelobarlobedlobesloboslobuslochelochslochylocielocislockslockylocoslocumlodenlodesloessloftsloganlogesloggylogialogielogoilogonlogoslohanloidsloinsloipeloirslokeslokeylokumlolasloledlollolollslollylologloloslomaslomedlomeslonerlongalongelongsloobylooedlooeyloofaloofslooielookslookyloomsloonsloonyloopsloordlootslopedloperlopesloppyloralloranlordslordylorelloresloriclorislosedlosellosenloseslossylotahlotaslotesloticlotoslotsalottalottelottolotuslouedloughlouielouisloumaloundlounsloupeloupslourelourslouryloutslovatlovedloveelovesloveylovielowanlowedlowenloweslowndlownelownslowpslowrylowselowthlowtsloxedloxeslozenluachluauslubedlubeslubralucesluckslucreludesludicludosluffaluffslugedlugerlugeslullsluluslumaslumbilummelummylumpslunasluneslunetlungilungslunksluntslupinluredlurerlureslurexlurgilurgylurkslurrylurveluserlushyluskslustslususlutealutedluterlutesluvvyluxedluxerluxeslweislyamslyardlyartlyaselycealyceelycralymeslynchlyneslyreslysedlyseslysinlysislysollyssalytedlyteslythelyticlyttamaaedmaaremaarsmabanmabesmacasmaccamacedmacermacesmachemachimachsmackamacksmaclemaconmactemadalmadarmaddymadgemadidmadosmadremaedimaerlmaficmaftsmagasmagesmaggsmagnamagotmagusmahalmahemmahismahoemahrsmahuamahwamaidsmaikomaiksmailemaillmailomailsmaimsmainsmairemairsmaisemaistmajasmajatmajoemajosmakafmakaimakanmakarmakeemakesmakiemakismakosmalaemalaimalammalarmalasmalaxmaleomalesmalicmalikmalismalkymallsmalmsmalmymaltsmaltymalusmalvamalwamamakmamasmambamambumameemameymamiemamilmanasmanatmandimandsmandymanebmanedmanehmanesmanetmangimangsmaniemanismanksmankymannamannymanoamanosmansemansomantamantemantomantsmantymanulmanusmanzomapaumapesmapoumappymaqammaquimaraemarahmaralmaranmarasmaraymarcsmardsmardymaresmargamargemargomargsmariamaridmarilmarkamarksmarlemarlsmarlymarmamarmsmaronmarormarramarrimarsemartsmaruamarvymasasmasedmasermasesmashamashymasksmassamassymastsmastymasurmasusmasutmataimatedmatermatesmathemathsmatinmatlomatramatsumattemattsmattymatzamatzomaubymaudsmaukamaulamaulsmaumsmaumymaundmauntmaurimausymautsmauvymauzymavenmaviemavinmavismawedmawksmawkymawlamawnsmawpsmawrsmaxedmaxesmaxismayanmayasmayedmayosmaystmazacmazakmazarmazasmazedmazelmazermazesmazetmazeymazutmbarimbarsmbilambirambretmbubembugameadsmeakemeaksmealsmeanemeansmeanymearemeasemeathmeatsmebbemebosmechamechsmecksmecummediimedinmedlemeechmeedsmeejameepsmeersmeetsmeffsmeidsmeikomeilsmeinsmeintmeinymeismmeithmekkamelammelasmelbamelchmeldsmelesmelicmelikmellsmeloemelosmeltsmeltymemesmemicmemosmenadmencemendsmenedmenesmengemengsmenilmensamensemenshmentamentomentsmenusmeousmeowsmerchmercsmerdemerdsmeredmerelmerermeresmerilmerismerksmerlemerlsmersemerskmesadmesalmesasmescameselmesemmesesmeshymesiamesicmesnemesonmessymestomesylmetasmetedmetegmetelmetesmethimethomethsmethymeticmetifmetismetolmetremettameumsmeusemevedmevesmewedmewlsmeyntmezesmezzamezzemezzomgalsmhorrmiaismiaoumiaowmiasmmiaulmicasmichemichimichtmicksmickymicosmicramiddymidgymidismiensmieuxmievemiffsmiffymiftymiggsmigmamigodmihasmihismikanmikedmikesmikosmikramikvamilchmildsmilermilesmilfsmiliamilkomilksmillemillsmillymilormilosmilpamiltsmiltymiltzmimedmimeomimermimesmimismimsyminaeminarminasmincymindimindsminedminesmingemingimingsmingyminisminkeminksminnyminosminsemintsminxymiraamirahmirchmiredmiresmirexmiridmirinmirknmirksmirkymirlsmirlymirosmirrlmirrsmirvsmirzamisalmischmisdomisesmisgomiskymislsmisosmissamistomistsmistymitasmitchmitermitesmiteymitiemitismitremitrymittamittsmiveymivvymixedmixenmixermixesmixiemixismixtemixupmiyasmizenmizesmizzymmkaymnememoaismoakymoalsmoanamoansmoanymoarsmoatsmobbymobedmobeemobesmobeymobiemoblemobosmocapmochimochsmochymocksmockymocosmocusmodermodesmodgemodiimodinmodocmodommodusmoenimoersmofosmogarmogasmoggymogosmogramoguemoharmohelmohosmohrsmohuamohurmoilemoilsmoiramoiremoitsmoitymojosmokermokesmokeymokismokkymokosmokusmolalmolasmoldsmoledmolermolesmoleymoliemollamollemollomollsmollymoloimolosmoltomoltsmoluemolvimolysmomesmomiemommamommemommymomosmompemomusmonadmonalmonasmondemondomonermongomongsmonicmoniemonksmonosmonpemontemontymoobsmoochmoodsmooedmooeymooksmoolamoolimoolsmoolymoongmoonimoonsmoonymoopsmoorsmoorymoothmootsmoovemopedmopermopesmopeymoppymopsymopusmoraemorahmoranmorasmoratmoraymoreemorelmoresmorgymoriamorinmormomornamornemornsmorormorramorromorsemortsmorukmosedmosesmoseymosksmossomostemostomostsmotedmotenmotesmotetmoteymothsmothymotismotonmottemottsmottymotusmotzamouchmouesmoufsmouldmoulemoulsmoulymoupsmoustmousymovedmovesmowasmowedmowiemowramoxasmoxiemoyasmoylemoylsmozedmozesmozosmpretmradsmsasamtepemuchomucicmucidmucinmuckomucksmucormucromudarmudgemudifmudimmudirmudramuffsmuffymuftimuggamuggsmuggymughomugilmugosmuhlymuidsmuilsmuirsmuirymuistmujikmukimmuktimulaimulctmuledmulesmuleymulgamuliemullamullsmulsemulshmumbomummsmumphmumpsmumsymumusmundsmundumungamungemungimungomungsmungymuniamunismunjamunjsmuntsmuntumuonsmurasmuredmuresmurexmurghmurgimuridmurksmurlsmurlymurramurremurrimurrsmurrymurthmurtimurukmurvamusarmuscamusedmuseemusermusesmusetmushamusitmusksmusosmussemussymustamusthmustsmutasmutchmutedmutermutesmuthamuticmutismutonmuttimuttsmutummuvvamuxedmuxesmuzakmuzzymvulamvulemvulimyallmyalsmylarmynahmynasmyoidmyomamyonsmyopemyopsmyopymysidmysiemythimythsmythymyxosmzeesnaamsnaansnaatsnabamnabbynabesnabisnabksnablanabobnachenachonacrenadasnaevenaevinaffsnagarnagasnagesnaggynagornahalnaiadnaibsnaicenaidsnaieonaifsnaiksnailsnailynainsnaiosnairanairunajibnakasnakednakernakfanalasnalednallanamadnamaknamaznamednamernamesnammanamusnanasnancenancynandunannananosnantenantinantonantsnantynanuanapasnapednapesnapohnapoonappanappenappynarasnarconarcsnardsnaresnaricnarisnarksnarkynarodnarranarrenashinashonasisnasonnasusnataknatchnatesnatisnattonattynatyanauchnauntnavarnavednavesnavewnavvynawabnawalnazarnazesnazirnazisnazzyndujaneafenealsneantneapsnearsneathneatoneatsnebbynebeknebelnechenecksneddyneebsneedsneefsneeldneeleneembneemsneepsneeseneezenefienegrinegronegusneifsneistneivenelianelisnellynemasnemicnemnsnemptnenesnentaneonsneosaneozanepernepitneralneramnerdsnerfsnerkanerksnerolnertsnertznervyneskinestsnestynetasnetesnetopnettanettsnettyneuksneumeneumsnevelnevesnevisnevusnevvynewbsnewednewelnewienewsynewtsnexalnexinnextsnexumnexusngaiongakanganangapingatingegengomangoningramngweenibbynicadnicedniceynichtnicksnickynicolnidalnidednidesnidornidusniefsniessnievenifesniffsniffynifleniftynigernigganighsnigreniguanihilnikabnikahnikaunilasnillsnimbinimbsnimbynimpsninerninesninonnintanioponiozanipasnipetnippyniqabnirlsnirlyniseinisinnissenisusnitalniternitesnitidnitonnitrenitronitrynittanittonittynivalnivasnivelnixednixernixesnixienizamnjirlnkosinmolinmolsnoahsnobbynocksnodalnoddynodednodesnodumnodusnoelsnoemanoemenogalnoggsnoggynohownoiasnoilsnoilynointnoirenoirsnokesnolesnollenollsnolosnomasnomennomesnomicnomoinomosnonannonasnoncenoncynondanondononesnonetnongsnonicnonisnonnanonnononnynonylnoobsnooisnooitnooksnookynoonenoonsnoopsnoovenopalnorianorienorisnorksnormanormsnosednosernosesnoshinosirnotalnotamnotednoternotesnotumnougsnoujanouldnoulenoulsnounsnounynoupsnoustnovaenovasnovianovionovumnowaynowdsnowednowlsnowtsnowtynoxalnoxasnoxesnoyaunoyednoyesnrttanrtyansimanubbynubianuchanucinnuddynudernudesnudgynudienudzhnuevonuffsnugaenujolnukednukesnullanullonullsnullynumbsnumennummynumpsnunksnunkynunnynunusnuquenurdsnurdynurlsnurrsnurtsnurtznusednusesnutsonutsynyaffnyalanyamsnyingnyongnyssanyungnyusenyuzeoafosoakedoakeroakumoaredoareroasaloasesoasisoastsoatenoateroathsoavesobangobbosobeahobeliobeysobiasobiedobiitobitsobjetoboesoboleoboliobolsoccamocherochesochreochryockerocoteocreaoctadoctanoctasocticoctlioctyloculiodahsodalsodeonodeumodismodistodiumodoomodorsodourodumsodyleodylsofaysoffedoffieoflagofterofuroogamsogeedogeesogginoghamogiveogledogleroglesogmicogresoheloohiasohingohmicohoneoicksoidiaoiledoileroiletoinksointsoiranojimeokapiokaysokehsokiesokingokoleokrasokrugoktasolateoldieoldlyolehsoleicoleinolentoleosoleumoleyloligooliosolivaollasollavollerollieologyolonaolpaeolpesomasaomberombusomdahomdasomddaomdehomeesomensomersomiaiomitsomlahommelomminomnesomovsomrahomulsonceroncesoncetoncusondesondolonelyonersoneryongononiumonkusonlaponlayonmunonnedonsenontalonticooaasoobitoohedooidsoojahoomphoontsoopakoopedoopsyoorieoosesootidooyahoozedoozesoozieoozleopahsopalsopensopepeoperyopgafopihiopingopposopsatopsinopsitoptedopteropzitorachoracyoralsorangoransorantorateorbatorbedorbicorcasorcinordieordosoreadorfesorfulorgiaorgicorgueoribiorielorigoorixaorlesorlonorlopormerorneeornisorpedorpinorrisortetorthoorvalorzososarsoscarosetroseysoshacosieroskinoslinosmicosmolosoneossiaostiaotakuotaryothylotiumottarottosoubitoucheouchtouedsouensouijaoulksoumasoundyoupasoupedoupheouphsoureyourieouselousiaoustsoutbyoutedoutenoutieoutreoutroouttaouzelouzosovalsovelsovensoversovismovistovoliovoloovuleowareowariowcheowersowiesowledowlerowletownedownioowresowrieowsenoxbowoxeasoxersoxeyeoxidsoxiesoximeoximsoxineoxlipoxmanoxmenoxteroyamaoyersozekiozenaozziepaahopaalspaanspacaipacaspacaypacedpacerpacespaceypachapackspackypacospactapactspadampadaspaddopadispadlepadmapadoupadrepadripaeanpaedopaeonpagedpagerpagespaglepagnepagodpagripahitpahospahuspaikspailspainspaipepaipspairepairspaisapaisepakaypakkapakkipakuapakulpalakpalarpalaspalaypaleapaledpalespaletpalispalkipallapallspallupallypalmspalmypalpipalpspalsapaluspambypampapanaxpancepanchpandapandspandypanedpanespangapangspanimpanirpankopankspannapannepannipannypantopantspantypaolipaolopapadpapaspapawpapespapeypappipappypapriparaeparasparchparcspardipardspardyparedparenpareoparespareuparevpargepargoparidparisparkiparksparkyparleparlyparmaparmoparmsparolparpsparraparrspartepartipartsparveparvopasagpasarpaschpaseopasespashapashmpaskapasmopaspypassepassupastspataspatedpateepatelpatenpaterpatespathspatiapatinpatkapatlypattapattepattupatuspauaspaulspauxipavanpavaspavedpavenpaverpavespavidpaviepavinpavispavonpavvypawaspawawpawedpawerpawkspawkypawlspawnspaxespayedpayorpaysdpeagepeagspeakepeakspeakypealspeanspearepearspeartpeasepeasypeatspeatypeavypeazepebaspechspeciapeckepeckspeckypectspedespedispedonpedospedropeecepeekspeekypeelspeelypeenspeentpeeoypeepepeepspeepypeerspeerypeevepeevopeggypeghspegmapegospeinepeinspeisepeisypeizepekanpekaupekeapekespekidpekinpekoepelaspelaupelchpelespelfspellspelmapelogpelonpelshpeltapeltspeluspendspendupenedpenespengopeniepenispenkspennapennipensepensypentspeolapeonspeonypeplapeplepeponpepospeppypepsipequiperaeperaipercepercsperduperdypereaperesperfsperisperksperleperlspermspermypernepernsperogperpsperryperseperspperstpertspervepervopervspervypeschpesospestapestspestypetarpeterpetitpetospetrepetripettipettopewedpeweepewitpeysepffttphagephangpharepharmphasmpheerphemephenepheonphesephialphiesphishphizzphloxphobephocaphonophonsphoohphooophotaphotsphotyphphtphubsphutsphutuphwatphylaphylephymaphynxphysapiaispianipianspibalpicalpicaspiccypiceypichipickspiconpicotpicrapiculpiedspiendpierspiertpietapietspiezopightpiglypigmypiingpikaspikaupikedpikelpikerpikespikeypikispikulpilaepilafpilaopilarpilaupilawpilchpileapiledpileipilerpilespileypilinpilispillspilonpilowpilumpiluspimaspimpspinaspinaxpincepindapindspinedpinerpinespingapingepingopingspinkopinkspinnapinnypinolpinonpinotpintapintspinuppionspionypiouspioyepioyspipalpipaspipedpipespipetpipidpipispipitpippypipulpiquipiraipirkspirlspirnspirogpirrepirripirrspiscopisespiskypisospissypistepitaspithspitonpitotpitsopitsupittapittupiumapiumspivospixespiyutpizedpizerpizesplaasplackplagaplageplaigplancplanhplansplapsplashplasmplastplatsplattplatyplaudplaurplavsplayaplayspleasplebeplebspleckpleeppleinplenapleneplenopleonpleshpletsplewsplexiplicapliespligsplimsplingplinkplipsplishploatploceplockplodsploitplombplongplonkplookplootplopsploreplotsplotzploukploutplowsplowtployeployspludspluespluffplugsplukeplumsplumyplungpluotplupspluteplutoplutyplyerpneuspoachpoakapoakepoalopobbypoboypocanpochepochopockspockypodalpoddypodexpodgepodgypodiapodospoduspoemspoenapoepspoetepoetspogeypoggepoggypogospoguepohedpoilupoindpoirepokalpokedpokespokeypokiepokitpoledpolerpolespoleypoliopolispoljepolkspollopollspollypolospoltspolyspomaspombepomespommepommypomospompapompsponceponcypondspondyponesponeypongapongopongspongyponksponorpontopontspontyponzupooaypoodspooedpooeypoofspoofypoohspoohypoojapookapookspoolspoolypoonspoopapoopspoopypooripoortpootspootypoovepoovypopespopiapopospoppapopsypopupporaeporalporedporerporesporeyporgeporgyporinporksporkypornopornspornyportaporteporthportsportyporusposcaposedposesposetposeyposhoposolpostepostspotaepotaipotchpotedpotespotinpotoopotropotsypottopottspottypoucepouffpoufspoufypouispoukepoukspoulepoulppoultpoupepouptpourspousypoutspovospowanpowiepowinpowispowltpowndpownspownypowrepowsypoxedpoxespoyaspoyntpoyoupoysepozzypraampradspragsprahupramspranaprangpraosprapsprasepratepratsprattpratyprausprayspreakpredypreedpreempreespreifprekepremspremyprentpreonpreopprepspresapreseprestpretapreuxpreveprexypreysprialprianpricypridypriefprierpriesprigsprillprimaprimiprimpprimsprimypringprinkprionpriseprisspriusproalproasprobsprobyproddprodsproemprofsprogsproinprokeproleprollpromopromspronkprookprootpropsproraproreprosoprossprostprosyprotoproulprowkprowsproynprunopruntprunyprutapryanpryerprysepseudpshawpshutpsiaspsionpsoaepsoaipsoaspsorapsychpsyopptishptypepubbypubcopubespubispubsypucanpucerpucespuckapuckspuddypudgepudicpudorpudsypuduspuerspuffapuffspuggypugilpuhaspujahpujaspukaspukedpukerpukespukeypukkapukuspulaopulaspuledpulerpulespulikpulispulkapulkspullipullspullypulmopulpspuluspulutpumaspumiepumpspumpypunaspuncepungapungipungopungspungypunimpunjipunkapunkspunkypunnypuntopuntspuntypupaepupalpupaspuppapupuspuraopuraupurdapurdypuredpurespurgapurinpurispurlspurospurpspurpypurrepurrspurrypursypurtypusespuslepussyputasputerputidputinputonputosputtiputtoputtsputtuputzapuukopuyaspuzelpuztapwnedpyatspyetspygalpyinspylonpynedpynespyoidpyotspyralpyranpyrespyrexpyricpyrospyruspyuffpyxedpyxespyxiepyxispzazzqadisqaidsqajaqqanatqapikqiblaqilasqipaoqophsqormaquabsquadsquaffquagsquairquaisquakyqualequalyquankquantquarequarlquassquatequatsquawkquawsquaydquaysqubitqueanqueckqueekqueemquemequenaquernquesoquetequeynqueysqueyuquibsquichquidsquiesquiffquilaquimsquinaquinequinkquinoquinsquintquipoquipsquipuquirequirlquirtquistquitsquoadquodsquoifquoinquoisquoitquollquonkquopsquorkquorlquoukquoysquranqurshquyteraadsraakerabatrabicrabisracedracesracheracksraconraddiraddyradgeradgyradifradixradonrafeeraffsraffyrafikrafiqraftsraftyragasragderagedrageeragerragesraggaraggsraggyragisragusrahedrahuiraiahraiasraidsraikeraiksrailerailsrainerainsrairdraitaraithraitsrajasrajesrakedrakeerakerrakesrakhirakiarakisrakkiraksirakusralesralliramalrameeramesrametramieraminramisrammyramonrampsramseramshramusranasrancerandorandsranedraneeranesrangarangirangsrangyranidranisrankeranksrannsrannyranserantsrantyrapedrapeeraperrapesrapherapinrapperapsoraredrareeraresrarksrasamrasasrasedraserrasesraspsrasserastaratalratanratasratchratedratelraterratesratharatherathsratooratosrattiratusrauliraunsrauporavedravelraverravesraveyravinrawdyrawerrawinrawksrawlyrawnsraxedraxesrayahrayasrayedrayleraylsraynerazairazedrazeerazerrazesrazetrazooreaddreadsreaisreaksrealorealsreamereamsreamyreansreapsreardrearsreastreatareatereaverebabrebberebecrebidrebitreboprebudrebuyrecalreccereccoreccyreceprecitrecksreconrectarecterectirectorecueredanreddsreddyrededredesrediaredidredifredigredipredlyredonredosredoxredryredubredugreduxredyereeafreechreedereedsreefsreefyreeksreekyreelsreelyreemsreensreerdreestreevereezerefanrefedrefelrefforefisrefixreflyrefryregarregesregetregexreggoregiaregieregleregmaregnaregosregotregurrehemreifsreifyreikireiksreinereingreinkreinsreirdreistreiverejasrejigrejonrekedrekesrekeyreletrelierelitrellorelosremanremapremenremetremexremixremourenayrendsrendureneyrengarengsrenigreninrenksrennerenosrenterentsreoilreorgrepasrepatrepegrepenrepinreplareposrepotreppsreprorepunreputreranrerigresamresatresawresayreseeresesresewresidresitresodresolresowrestorestsrestyresueresusretagretamretaxretemretiaretieretinretipretoxreunereupsrevetrevierevowrewanrewaxrewedrewetrewinrewonrewthrexesrezesrhabdrheasrheidrhemerheumrhiesrhimerhinerhodyrhombrhonerhumbrhymyrhynerhytariadsrialsriantriatariatoribasribbyribesricedricerricesriceyricherichtricinricksridesridgyridicrielsriemsrieveriferriffsriffyrifteriftsriftyriggsrigmorigolrikkarikwariledrilesrileyrillerillsrillyrimaerimedrimerrimesrimonrimusrincerindsrindyrinesringeringsringyrinksriojarioneriotsriotyripedripesrippsriqqsrisesrishirisksrispsristsrisusritesritherittsritzyrivasrivedrivelrivenrivesriyalrizasroadsroadyroakeroakyroamsroansroanyroarsroaryroaterobborobedroberrobesroblerobugroburrocherocksrodedrodesrodnyroersroganroguyrohanrohesrohunrohusroidsroilsroilyroinsroistrojakrojisrokedrokerrokesrokeyrokosrolagroleorolesrolfsrollsrollyromalromanromeoromerrompsrompurompyronderondoroneoronesroninronneronterontsronukroodsroofsroofyrooksrookyroomsroonsroopsroopyroosarooserootsrootyropedroperropesropeyroqueroralroresroricroridrorierortsrortyrosalroscorosedrosesrosetrosharoshirosinrositrospsrossarossorostirostsrotalrotanrotasrotchrotedrotesrotisrotlsrotonrotosrottarotterottorottyrouenrouesrouetroufsrougyrouksroukyrouleroulsroumsroupsroupyroustrouthroutsrovedrovenrovesrowanrowedrowelrowenrowetrowierowmerowndrownsrowthrowtsroyetroyneroystrozesrozetrozitruachruanarubairubanrubbyrubelrubesrubinrubiorublerubliruborrubusrucheruchyrucksrudasruddsrudesrudierudisruedaruersrufferuffsruffyrufusrugaerugalrugasruggyruiceruingruinsrukhsruledrulesrullyrumalrumborumenrumesrumlyrummyrumporumpsrumpyruncerunchrundsrunedrunerrunesrungsrunicrunnyrunosruntsruntyrunupruoterupiarurpsrurusrusasrusesrushyrusksruskyrusmarusserustsruthsrutinruttyruvidryalsrybatryijiryijyrykedrykesrymerrymmeryndsryotiryotsryperrypinrytheryugisaagssabalsabedsabersabessabhasabinsabirsabjisablesabossabotsabrasabresabzisackssacrasacresaddosaddysadessadhesadhusadicsadissadossadzasaetasafedsafessagarsagassagersagessaggysagossagumsahabsahebsahibsaicesaicksaicssaidssaigasailssaimssainesainssairssaistsaithsajousakaisakersakessakiasakissaktisalalsalassalatsalepsalessaletsalicsalissalixsallesalmisalolsalopsalpasalpssalsesaltosaltssaludsaluesalutsamansamassambasambosameksamelsamensamessameysamfisamfusammysampisampssanadsandssanedsanessangasanghsangosangssankosansasantosantssaolasapansapidsaporsaransardssaredsareesargesargosarinsarirsarissarkssarkysarodsarossarussarvosasersasinsassesataisataysatedsatemsatersatessatissaubasauchsaughsaulssaultsaunfsauntsaurysautssauvesavedsaversavessaveysavinsawahsawedsawersaxessayassayedsayeesayersayidsaynesayonsaystsazesscabsscadsscaffscagsscailscalascallscamsscandscansscapascapescapiscarpscarsscartscathscatsscattscaudscaupscaurscawssceatscenascendschavschifschmoschulschwascifiscindsciresclimscobescodyscogsscoogscootscopascopsscorpscotescotsscougscoupscowpscowsscrabscraescragscranscratscrawscrayscrimscripscrobscrodscrogscrooscrowscudiscudoscudsscuffscuftscugssculkscullsculpsculsscumsscupsscurfscursscusescutascutescutsscuzzscyessdaynsdeinsealsseameseamsseamyseanssearesearsseaseseatsseazesebumseccosechssectssedersedessedgesedgysedumseedsseeksseeldseelsseelyseemsseepsseepyseerssefersegarsegassegnisegnosegolsegossehriseifsseilsseineseirsseiseseismseityseizasekossektsselahselesselfsselfyselkysellasellesellsselvasemassemeesemessemiesemissenassendssenessenexsengisennasenorsensasensisensusentesentisentssenvysenzasepadsepalsepicsepoysepposeptaseptsseracseraiseralseredsererseresserfssergeseriasericserinserirserksseronserowserraserreserrsserryservoseseysessasetaesetalsetersethssetonsettssevaksevirsewansewarsewedsewelsewensewinsexedsexersexessexorsextosextsseyensezesshadsshagsshahsshakashakoshaktshalmshalyshamashamsshandshansshapssharnshartshashshaulshawmshawnshawsshayashaysshchisheafshealsheasshedssheelshendshengshentsheolsherdsheresheroshetsshevashewnshewsshiaishielshiershiesshillshilyshimsshinsshiokshipsshirrshirsshishshisoshistshiteshitsshiurshivashiveshivsshlepshlubshmekshmoeshoatshoedshoershoesshogishogsshojishojosholashonkshoolshoonshoosshopeshopsshorlshoteshotsshottshoudshowdshowsshoyushredshrisshrowshtarshtikshtumshtupshubashuleshulnshulsshunsshurashuteshutsshwasshyersialssibbssibiasibylsicessichtsickosickssickysidassidedsidersidessideysidhasidhesidlesieldsienssientsiethsieursiftssighssigilsiglasignasignssigrisijossikassikersikessildssiledsilensilersilessilexsilkssillssilossiltssiltysilvasimarsimassimbasimissimpssimulsindssinedsinessingssinhssinkssinkysinsisinussipedsipessippysiredsireesiressirihsirissirocsirrasirupsisalsisessistasistssitarsitchsitedsitessithesitkasitupsitussiversixersixessixmosixtesizarsizedsizelsizersizesskagsskailskaldskankskarnskartskatsskattskawsskeanskearskedsskeedskeefskeenskeerskeesskeetskeevskeezskeggskegsskeinskelfskellskelmskelpskeneskensskeosskepsskermskerssketsskewsskidsskiedskiesskieyskimoskimsskinkskinsskintskiosskipsskirlskirrskiteskitsskiveskivysklimskoalskobeskodyskoffskofsskogsskolsskoolskortskoshskranskrikskrooskuasskugsskyedskyerskyeyskyfsskyreskyrsskyteslabssladeslaesslagsslaidslakeslamsslaneslankslapsslartslatsslatyslaveslawsslaysslebssledssleerslewssleysslierslilyslimsslipeslipssliptslishslitsslivesloanslobssloesslogssloidslojdslokaslomosloomslootslopsslopyslormslotssloveslowssloydslubbslubssluedsluessluffslugssluitslumsslurbslurssluseslutsslyerslypesmaaksmaiksmalmsmaltsmarmsmazesmeeksmeessmeiksmekesmerksmewssmicksmilysmirrsmirssmitssmizesmogssmokosmoltsmoorsmootsmoresmorgsmoutsmowtsmugssmurssmushsmutssnabssnafusnagssnapssnarfsnarksnarssnarysnashsnathsnawssneadsneapsnebssnecksnedssneedsneessnellsnibssnicksniedsniessniftsnigssnipssnipysnirtsnitssnivesnobssnodssnoeksnoepsnogssnokesnoodsnooksnoolsnootsnotssnowksnowssnubssnugssnushsnyessoakssoapssoaresoarssoavesobassocassocessociasockosockssoclesodassoddysodicsodomsofarsofassoftasoftssoftysogersohursoilssoilysojassojussokahsokensokessokolsolahsolansolassoldesoldisoldosoldssoledsoleisolersolessolonsolossolumsolussomansomassoncesondesonessongosongssongysonlysonnesonnysonsesonsysooeysookssookysoolesoolssoomssoopssootesootssophssophysoporsoppysoprasoralsorassorbisorbosorbssordasordosordssoredsoreesorelsorersoressorexsorgosornssorrasortasortssorussothssotolsottosoucesouctsoughsoukssoulssoulysoumssoupssoupysourssousesoutssowarsowcesowedsowffsowfssowlesowlssowmssowndsownesowpssowsesowthsoxessoyassoylesoyuzsozinspackspacyspadospadsspaedspaerspaesspagsspahispailspainspaitspakespaldspalespallspaltspamsspanespangspansspardsparsspartspatespatsspaulspawlspawsspaydspaysspazaspazzspealspeanspeatspecsspectspeelspeerspeilspeirspeksspeldspelkspeosspeshspetsspeugspewsspewyspialspicaspickspicsspidespierspiesspiffspifsspiksspilespimsspinaspinkspinsspirtspiryspitsspitzspivssplaysplogspodespodsspoomspoorspootsporksposasposhsposospotsspradspragspratspredsprewspritsprodsprogspruesprugspudsspuedspuerspuesspugsspulespumespumyspurssputaspyalspyresquabsquawsqueesquegsquidsquitsquizsrslystabsstadestagsstagystaigstanestangstansstaphstapsstarnstarrstarsstarystatsstatustaunstawsstayssteanstearsteddstedestedssteeksteemsteensteezsteiksteilstelastelestellstemestemsstendstenostensstentstepssteptsterestetsstewsstewysteysstichstiedstiesstilbstilestimestimsstimystipastipestirestirkstirpstirsstivestivystoaestoaistoasstoatstobsstoepstogsstogystoitstolnstomastondstongstonkstonnstookstoorstopestopsstoptstossstotsstottstounstoupstourstownstowpstowsstradstraestragstrakstrepstrewstriastrigstrimstropstrowstroystrumstubsstucsstudestudsstullstulmstummstumsstunsstupastupesturesturtstushstyedstyesstylistylostymestymystyrestytesubahsubaksubassubbysubersubhasuccisuckssuckysucresudansuddssudorsudsysuedesuentsuerssuetesuetssuetysugansughssugossuhursuidssuintsuitssujeesukhssukissukuksulcisulfasulfosulkssullssulphsulussumissummasumossumphsumpssunissunkssunnasunnssuntssunupsuonasupedsupessuprasurahsuralsurassuratsurdssuredsuressurfssurfysurgysurrasusedsusessusussutorsutrasuttaswabsswackswadsswageswagsswailswainswaleswalyswamyswangswankswansswapsswaptswardswareswarfswartswatsswaylswaysswealswedesweedsweelsweersweessweirsweltswerfsweysswiesswigsswileswimsswinkswipeswireswissswithswitsswiveswizzswobsswoleswollswolnswopsswoptswotsswounsybbesybilsyboesybowsyceesycessyconsyedssyenssykersykessylissylphsylvasymarsynchsyncssyndssynedsynessynthsypedsypessyphssyrahsyrensysopsythesyvertaalstaatatabactabertabestabidtabistablatablstabortabostabuntabustacantacestacettachetachitachotachstackstacostactstadahtaelstafiataggytagmataguatahastahrstaigataigstaikotailstainstairataishtaitstajestakastakestakhitakhttakintakistakkytalaktalaqtalartalastalcstalcytaleatalertalestaliktalkstalkytallstalmatalpataluktalustamaltamastamedtamestamintamistammytampstanastangatangitangstanhstaniatankatankstankytannatansutansytantetantitantotantytapastapedtapentapestapettapistappatapustarastardotardstaredtarestargatargetarkatarnstaroctaroktarostarpstarretarrytarsetarsitartetartstartytarzytasartascatasedtasertasestaskstassatassetassotastotatartatertatestathstatietatoutattstatustaubetauldtauontaupetautstautytavahtavastavertawaftawaitawastawedtawertawietawsetawtstaxedtaxertaxestaxistaxoltaxontaxortaxustayratazzatazzeteadeteadsteaedteakstealsteamstearsteatsteazetechstechytectatecumteelsteemsteendteeneteensteenyteersteetsteffsteggsteguategusteheetehrsteiidteilsteindteinstekketelaetelcotelestelexteliatelictellstellyteloitelostemedtemestempitempstempttemsetenchtendstendutenestengeteniatennetennotennytenontentstentytenuetepaltepastepoyteraiterasterceterekteresterfeterfstergatermsterneternsterreterrytertsterzateslatestatesteteststetestethstetratetriteuchteughtewedteweltewittexastexestextatextsthackthagithaimthalethalithanathanethangthansthanxtharmtharsthawsthawtthawythebethecatheedtheektheesthegntheictheinthelfthemathenstheortheowthermthespthetethewsthewythigsthilkthillthinethinsthiolthirlthofttholetholithorothorpthotsthousthowlthraethrawthridthripthroethudsthugsthujathunkthurlthuyathymithymytianstiaretiarsticalticcaticedticestichytickstickytiddytidedtidestiefstierstiffstifostiftstigestigontikastikestikiatikistikkatilaktiledtilertilestillstillytilthtiltstimbotimedtimestimontimpstinastincttindstineatinedtinestingetingstinkstinnytintotintstintytipistippytipuptiredtirestirlstirostirrstirthtitartitastitchtitertithititintitirtitistitretittytituptiyintiynstizestizzytoadstoadytoazetockstockytocostoddetodeatodostoeastoffstoffytoftstofustogaetogastogedtogestoguetohostoidytoiletoilstoingtoisetoitstoitytokaytokedtokertokestokostolantolartolastoledtolestollstollytoltstolustolyltomantombotombstomentomestomiatomintommetommytomostomoztonditondotonedtonertonestoneytongstonkatonkstonnetonustoolstoomstoonstootstopedtopeetopektopertopestophetophitophstopistopoitopostoppytoquetorahtorantorastorcstorestorictoriitorostorottorrstorsetorsitorsktortatortetortstosastosedtosestoshytossytosyltotedtotertotestottytoukstounstourstousetousytoutstouzetouzytowaitowedtowietownotownstownytowsetowsytowtstowzetowzytoyedtoyertoyontoyostozedtozestozietrabstradstradytragatragitragstragutraiktramstranktranqtranstranttrapetrapotrapstrapttrasstratstratttravetrayftraystrecktreedtreentreestrefatreiftrekstrematremstresstresttretstrewstreyftreystriactridetriertriestrifatrifftrigotrigstriketrildtrilltrimstrinetrinstrioltriortriostripstripytristtroadtroaktroattrocktrodetrodstrogstroistroketromptronatronctronetronktronstrooztropotrothtrotstrowstroystruedtruestrugotrugstrulltryertryketrymatrypstsadetsaditsarstskedtsubatsubotuanstuarttuathtubaetubartubastubbytubedtubestuckstufastuffetuffstuftstuftytugratuiletuinatuismtuktutulestulpatulpstulsitumidtummytumpstumpytunastundstunedtunertunestungstunnytupektupiktupletuqueturdsturfsturfyturksturmeturmsturnsturntturonturpsturrstushytuskstuskytuteetutestuttituttytutustuxestuyertwaestwaintwalstwanktwatstwaystweeltweentweeptweertwerktwerptwiertwigstwilltwilttwinktwinstwinytwiretwirktwirptwitetwitstwocstwoertwonktwyertyeestyerstyiyntykestylertympstyndetynedtynestypaltypedtypestypeytypictypostyppstyptotyrantyredtyrestyrostythetzarsubacsubityudalsudonsudyogugaliuggeduhlanuhuruukaseulamaulansulemaulminulmosulnadulnaeulnarulnasulpanulvasulyieulzieumamiumbelumberumbleumbosumbreumiacumiakumiaqummahummasummedumpedumphsumpieumptyumrahumrasunagiunaisunaptunarmunaryunausunbagunbanunbarunbedunbidunboxuncapuncesunciauncosuncoyuncusundamundeeundosundugunethunfixungagungetungodungotungumunhatunhipunicauniosunitsunjamunkedunketunkeyunkidunkutunlapunlawunlayunledunlegunletunlidunmadunmanunmewunmixunodeunoldunownunpayunpegunpenunpinunplyunpotunputunredunridunrigunripunsawunsayunseeunsewunsexunsodunsubuntaguntaxuntinunwetunwitunwonupbowupbyeupdosupdryupendupfulupjetuplayupleduplituppedupranuprunupseeupseyuptakupteruptieuraeiuraliuraosurareurariuraseurateurbexurbiaurdeeurealureasuredoureicureidurenaurenturgedurgerurgesurialuriteurmanurnalurnedurpedursaeursidursonurubuurupaurvasusensusersusetausneausnicusqueustadusterusureusuryuteriuterouvealuveasuvulavacasvacayvacuavacuivacuovadasvadedvadesvadgevagalvagusvaidsvailsvairevairsvairyvajravakasvakilvalesvalisvallivalsevampsvampyvandavanedvanesvangavangsvantsvapedvapervapesvaranvarasvardavardovardyvarecvaresvariavarixvarnavarusvarvevasalvasesvastsvastyvatasvathavaticvatjevatosvatusvauchvautevautsvawtevaxesvealevealsvealyveenaveepsveersveeryvegasvegesveggovegievegosvehmeveilsveilyveinsveinyvelarveldsveldtvelesvellsvelumvenaevenalvenasvendsvenduveneyvengeveninventiventsvenusverbaverbsverdeverraverreverryversaverstvertevertsvertuvespavestavestsvetchveuvevevesvexedvexervexesvexilvezirvialsviandvibedvibesvibexvibeyvicedvicesvichyvicusviersvieuxviewsviewyvifdaviffsvigasvigiavildevilervillevillivillsvimenvinalvinasvincavinedvinervinesvinewvinhovinicvinnyvinosvintsvioldviolsviredvireoviresvirgavirgevirgoviridvirlsvirtuvisasvisedvisesvisievisnavisnevisonvistovitaevitasvitexvitrovittavivasvivatvivdavivervivesvivosvivrevizirvizorvlastvleisvliesvlogsvoarsvoblavocabvocesvoddyvodouvodunvoemavogievoicivoidsvoilevoipsvolaevolarvoledvolesvoletvolkevolksvoltavoltevoltivoltsvolvavolvevomervotedvotesvougevouluvowedvowervoxelvoxesvozhdvraicvrilsvroomvrousvrouwvrowsvuggsvuggyvughsvughyvulgovulnsvulvavuttyvygiewaacswackewackowackswadaswaddswaddywadedwaderwadeswadgewadiswadtswaffswaftswagedwageswaggawagyuwahaywaheywahoowaidewaifswaiftwailswainswairswaitewaitswakaswakedwakenwakerwakeswakfswaldowaldswaledwalerwaleswaliewaliswalkswallawallswallywaltywamedwameswamuswandswanedwaneswaneywangswankswankywanlewanlywannawantawantswantywanzewaqfswarbswarbywardswaredwareswarezwarkswarmswarnswarpswarrewarstwartswaseswashiwashywasmswaspswaspywastswatapwattswauffwaughwaukswaulkwaulswaurswavedwaveswaveywawaswaweswawlswaxedwaxerwaxeswayedwazirwazoowealdwealsweambweanswearswebbyweberwechtwedelwedgyweedsweeisweekeweeksweelsweemsweensweenyweepsweepyweestweeteweetswefteweftsweidsweilsweirsweiseweizewekasweldswelkewelkswelktwellswellyweltswembswenchwendswengewennywentswerfsweroswershwestswetaswetlywexedwexeswhamowhamswhangwhapswharewhatawhatswhaupwhaurwhealwhearwheekwheenwheepwheftwhelkwhelmwhenswhetswhewswheyswhidswhieswhiftwhigswhilkwhimswhinswhioswhipswhiptwhirrwhirswhishwhisswhistwhitswhitywhizzwhompwhoofwhootwhopswhorewhorlwhortwhosowhowswhumpwhupswhydawiccawickswickywiddywideswielswifedwifeswifeywifiewiftswiftywiganwiggawiggywikiswilcowildswiledwileswilgawiliswiljawillswiltswimpswindswinedwineswineywingewingswingywinkswinkywinnawinnswinoswinzewipedwiperwipeswiredwirerwireswirrawirriwisedwiseswishawishtwispswistswitanwitedwiteswithewithswithywivedwiverwiveswizenwizeswizzowoadswoadywoaldwockswodgewodgywofulwojuswokerwokkawoldswolfswollywolvewomaswombswombywomynwongawongiwonkswonkywontswoodswooedwoofswoofywooldwoolswoonswoopswoopywoosewooshwootzwordsworksworkywormswormywortswowedwoweewowsewoxenwrangwrapswraptwrastwratewrawlwrenswrickwriedwrierwrieswritswrokewrootwrothwryerwuddywuduswuffswullswungawurstwuseswushuwussywuxiawyledwyleswyndswynnswytedwyteswythexebecxeniaxenicxenonxericxeroxxerusxoanaxolosxraysxviiixylanxylemxylicxylolxylylxystixystsyaarsyaassyabasyabbayabbyyaccayackayacksyaddayaffsyageryagesyagisyagnayahooyairdyajnayakkayakowyalesyamenyampayampyyamunyandyyangsyanksyapokyaponyappsyappyyarakyarcoyardsyareryarfayarksyarnsyarrayarrsyartayartoyatesyatrayaudsyauldyaupsyawedyaweyyawlsyawnsyawnyyawpsyayasyboreycladycledycondydradydredyeadsyeahsyealmyeansyeardyearsyecchyechsyechyyedesyeedsyeeekyeeshyeggsyelksyellsyelmsyelpsyeltsyentayenteyerbayerdsyerksyesesyesksyestsyestyyetisyettsyeuchyeuksyeukyyevenyevesyewenyexedyexesyfereyikedyikesyillsyinceyipesyippyyirdsyirksyirrsyirthyitesyitieylemsylideylidsylikeylkesymoltympesyobboyobbyyocksyodelyodhsyodleyogasyogeeyoghsyogicyoginyogisyohahyohayyoickyojanyokanyokedyokegyokelyokeryokesyokulyolksyolkyyolpsyomimyompsyonicyonisyonksyonnyyoofsyoopsyoposyoppoyoresyorgayorksyorpsyouksyournyoursyourtyouseyowedyowesyowieyowlsyowsayowzayoyosyraptyrentyrivdyrnehysameytostyuansyucasyuccayucchyuckoyucksyuckyyuftsyugasyukedyukesyukkyyukosyulanyulesyummoyummyyumpsyuponyuppyyurtayurtsyuzuszabrazackszaidazaidezaidyzairezakatzamaczamakzamanzambozamiazamiszanjazantezanzazanzezappyzardazarfszariszatiszawnszaxeszaydezayinzazenzealszebeczebubzebuszedaszeerazeinszendozerdazerkszeroszestszetaszexeszezeszhomozhushzhuzhzibetziffsziganzikrszilaszilchzillazillszimbizimbszincozincszincyzinebzineszingszingyzinkezinkyzinoszippozippyziramzitiszittyzizelzizitzlotezlotyzoaeazoboszobuszoccozoeaezoealzoeaszoismzoistzokorzollezombizonaezondazonedzonerzoneszonkszooeazooeyzooidzookszoomszoomyzoonszootyzoppazoppozorilzoriszorrozorsezoukszoweezowiezuluszupanzupaszuppazurfszuzimzygalzygonzymeszymiccigarrebutsissyhumphawakeblushfocalevadenavalserveheathdwarfmodelkarmastinkgradequietbenchabatefeignmajordeathfreshcruststoolcolonabasemarryreactbattyprideflosshelixcroakstaffpaperunfedwhelptrawloutdoadobecrazysowerrepaydigitcratecluckspikemimicpoundmaximlinenunmetfleshboobyforthfirststandbellyivoryseedyprintyearndrainbribestoutpanelcrassflumeoffalagreeerrorswirlarguebleeddeltaflicktotemwooerfrontshrubparrybiomelapelstartgreetgonergolemlustyloopyroundauditlyinggammalaborisletcivicforgecornymoultbasicsaladagatespicysprayessayfjordspendkebabguildabackmotoralonehatchhyperthumbdowryoughtbelchdutchpilottweedcometjauntenemasteedabyssgrowlflingdozenboozyerodeworldgougeclickbriargreataltarpulpyblurtcoastduchygroinfixergrouproguebadlysmartpithygaudychillheronvodkafinersurerradiorougeperchretchwroteclocktildestoreprovebringsolvecheatgrimeexultusherepochtriadbreakrhinoviralconicmassesonicvitaltraceusingpeachchampbatonbrakepluckcrazegripewearypickyacuteferryasidetapirtrollunifyrebusboosttrusssiegetigerbanalslumpcrankgorgequerydrinkfavorabbeytangypanicsolarshireproxypointrobotprickwincecrimpknollsugarwhackmountperkycouldwrunglightthosemoistshardpleataloftskillelderframehumorpauseulcerultrarobincynicaromacaulkshakedodgeswilltacitotherthorntroveblokevividspillchantchokerupeenastymournaheadbrineclothhoardsweetmonthlapsewatchtodayfocussmeltteasecatermoviesauteallowrenewtheirsloshpurgechestdepotepoxynymphfoundshallstovelowlysnouttropefewershawlnatalcommaforayscarestairblacksquadroyalchunkminceshamecheekampleflairfoyercargooxideplantoliveinertaskewheistshownzestytrashlarvaforgostoryhairytrainhomerbadgemidstcannyshinegeckofarceslungtipsymetalyielddelvebeingscourglassgamerscrapmoneyhingealbumvouchassettiaracreptbayouatollmanorcreakshowyphasefrothdepthgloomfloodtraitgirthpietygoosefloatdonoratoneprimoapronblowncacaoloserinputgloatawfulbrinksmitebeadyrustyretrodrollgawkyhutchpintoegretlilacseverfieldfluffagapevoicesteadberthmadamnightblandliverwedgeroomywackyflockangrytriteaphidtrystmidgepowerelopecinchmottostompupsetbluffcrampquartcoylyyouthrhymebuggyaliensmearunfitpattyclinggleanlabelhunkykhakipokergrueltwicetwangshrugtreatwastemeritwovenneedyclownironyrudergauzechiefonsetprizefungicharmgullyinterwhooptauntleeryclassthemeloftytibiaboozealphathymedoubtparerchutesticktricealikerecapsaintglorygrateadmitbrisksoggyusurpscaldscornleavetwinestingboughmarshslothdandyvigorhowdyenjoyvalidionicequalfloorcatchspadesteinexistquirkdenimgrovespielmummyfaultfoggyfloutcarrysneaklibelwaltzaptlypineyineptaloudphotodreamstaleunitesnarlbakerthereglyphpoochhippyspellfollylousegulchvaultgodlythrewfleetgraveinaneshockcravespitevalveskimpclaimrainymustypiquedaddyquasiariseagingvaletopiumavertstuckrecutmulchgenreplumeriflecountincurtotalwrestmochadeterstudyloversaferrivetfunnysmokemoundunduesedanpaganswineguilegustyequiptoughcanoechaoscovethumanudderlunchblaststraymangameleeleftyquickpastegivenoctetrisengroanleakygrindcarveloosesadlyspiltappleslackhoneyfinalsheeneeriemintyslickderbywharfspeltcoacheruptsingepricespawnfairyjiffyfilmystackchosesleepardornannyniecewoozyhandygracedittostankcreamusualdiodevalorangleninjamuddychasereplypronespoilheartshadedinerarsononionsleetdowelcouchpalsybowelsmileevokecreeklanceeagleidiotsirenbuiltembedawarddrossannulgoodyfrownpatioladenhumidelitelymphedifymightresetvisitgustopursevaporcrockwritesunnyloathchaffslidequeervenomstampsorrystillacornapingpushytamerhatermaniaawokebrawnswiftexilebirchluckyfreerriskyghostplierlunarwinchsnarenursehouseboraxnicerlurchexaltaboutsavvytoxintunicpriedinlaychumplankycresseatereludecyclekittyboulemorontenetplacelobbyplushvigilindexblinkclungqualmcroupclinkjuicystagedecaynervefliershaftcrookcleanchinaridgevowelgnomesnuckicingspinyrigorsnailflownrabidprosethankpoppybudgefibermoldydowdykneeltrackcaddyquelldumpypalersworerebarscubasplatflyerhornymasondoingozoneamplymolarovarybesetqueuecliffmagictrucesportfritzedicttwirlversellamaeatenrangewhiskhovelrehabmacawsigmaspoutvervesushidyingfetidbrainbuddythumpscioncandychordbasinmarchcrowdarborgaylymuskystaindallyblessbravostungtitlerulerkioskblondennuilayerfluidtattyscorecutiezebrabargemateyblueraidershookriverprivybetelfriskbongobegunazureweavegeniesoundglovebraidscopewrylyroverassayoceanbloomiratelaterwokensilkywreckdweltslatesmacksolidamazehazelwristjollyglobeflintrousecivilvistarelaxcoveralivebeechjettyblissvocaloftendollyeightjokersinceeventensueshuntdiverposerworstsweepalleycreedanimeleafybosomduncestarepudgywaivechoirstoodspokeoutgodelaybilgeidealclaspseizehotlylaughsieveblockmeantgrapenoosehardyshieddrawldaisyputtystrutburnttulipcrickidyllvixenfurorgeekycoughnaiveshoalstorkbatheauntycheckprimebrassouterfurryrazorelectevictimplydemurquotahavencavilswearcrumpdoughgavelwagonsalonnudgeharempitchswornpupilexcelstonycabinunzipqueentroutpolypearthstormuntiltaperenterchildadoptminorfattyhuskybravefiletslimeglinttreadstealregalguesteverymurkysharesporehoistbuxominnerotterdimlylevelsumacdonutstiltarenasheetscrubfancyslimypearlsillyporchdingosepiaambleshadybreadfriarreigndairyquillcrossbroodtubershearpositblankvillashankpiggyfreakwhichamongfecalshellwouldalgaelargerabbiagonyamusebushycopseswoonknifepouchascotplanecrownurbansniderelayabideviolarajahstrawdillycrashamassthirdtricktutorwoodyblurbgriefdiscowheresassybeachsaunacomiccluedcreepcastegrazesnufffrockgonaddrunkprongluridsteelhalvebuyervinylutilesmelladageworrytastylocaltradefinchashenmodalgauntcloveenactadornroastspecksheikmissygruntsnooppartytouchmafiaemceearraysouthvapidjellyskulkangsttuballowercrestsweatcyberadoretardyswaminotchgroomroachhitchyoungalignreadyfrondstrappureerealmvenueswarmoffersevendryerdiarydrylydrankacridheadythetajuntopixiequothbonusshaltpenneamenddatumbuildpianoshelflodgesuingrearmcoralramenworthpsalminferovertmayorovoidglideusagepoiserandychuckprankfishytoothetherdroveidlerswathstintwhilebegatapplyslangtarotradarcredoawarecanonshifttimerbylawserumthreesteakiliacshirkbluntpuppypenaljoistbunnyshapebegetwheeladeptstuntstoletopazchoreflukeafootbloatbullydensecapersneerboxerjumbolungespaceavailshortslurployalflirtpizzaconchtempodroopplatebibleplunkafoulsavoysteepagilestakedwellknavebeardarosemotifsmashbroilglareshovebaggymammyswampalongrugbywagerquacksquatsnakydebitmangeskateninthjousttrampspurnmedalmicrorebelflanklearnnadirmaplecomfyremitgruffesterleastmogulfetchcauseoakenaglowmeatygaffeshylyracerprowlthiefsternpoesyrockytweetwaistspiregropehavocpatsytrulyfortydeityuncleswishgiverpreenbevellemurdraftslopeannoylingobleakdittycurlycedardirgegrownhordedroolshuckcryptcuminstockgravylocuswiderbreedquitechafecacheblimpdeignfiendlogiccheapeliderigidfalserenalpencerowdyshootblazeenvoypossebriefneverabortmousemuckysulkyfierymediatrunkyeastclearskunkscalpbittyciderkoaladuvetseguecremesupergrillafterowneremberreachnoblyemptyspeedgipsyrecursmockdreadmergeburstkappaamityshakyhovercarolsnortsynodfainthauntflourchairdetoxshrewtensepliedquarkburlynovelwaxenstoicjerkyblitzbeefylyrichussytowelquiltbelowbingowispybrashsconetoasteaselsaucyvaluespicehonorroutesharpbawdyradiiskullphonyissuelagerswellurinegassytrialfloraupperlatchwightbrickretryhollydecalgrassshackdogmamoverdefersoberopticcriervyingnomadflutehipposharkdrierobesebugletawnychalkfeastruddypedalscarfcruelbleattidalslushsemenwindydustysallyigloonerdyjewelshonewhalehymenabusefugueelbowcrumbpansywelshsyruptersesuavegamutswungdrakefreedafireshirtgroutoddlytitheplaiddummybroomblindtorchenemyagaintyingpeskyaltergazernobleethosbrideextoldecorhobbybeastidiomutterthesesixthalarmeraseelegyspunkpiperscalyscoldheftychicksootycanalwhinyslashquakejointsweptprudeheavywieldfemmelassomaizeshalescrewspreesmokywhiffscentgladespentprismstokeriperorbitcocoaguilthumusshushtablesmirkwrongnoisyalertshinyelateresinwholehunchpixelpolarhotelswordcleatmangorumbapuffyfillybillyleashcloutdanceovatefacetchilipaintlinercuriosaltyaudiosnakefablecloaknavelspurtpestobalmyflashunwedearlychurnweedystumpleasewittywimpyspoofsanerblendsalsathickwartymanicblaresquibspoonprobecrepeknackforcedebutorderhasteteethagentwidenicilysliceingotclashjurorbloodabodethrowunitypivotslepttroopsparesewerparsemorphcactitackyspooldemonmoodyannexbeginfuzzypatchwaterlumpyadminomegalimittabbymachoaisleskiffbasisplankvergebotchcrawllousyslaincubicraisewrackguidefoistcameounderactorrevuefraudharpyscoopclimbreferoldenclerkdebartallyethiccairntulleghoulhillycrudeapartscaleolderplainspermbrinyabbotrerunquestcrispboundbefitdrawnsuiteitchycheerbagelguessbroadaxiomchardcaputleantharshcurseproudswingopinetastelupusgumbominergreenchasmlipidtopicarmorbrushcranemuralabledhabitbossymakerduskydizzylithebrookjazzyfiftysensegiantsurlylegalfatalflunkbeganprunesmallslantscofftorusninnycoveyvipertakenmoralvogueowingtokenentryboothvoterchideelfinebonyneighminimmelonkneeddecoyvoilaanklearrowmushytribeceaseeagerbirthgraphodderterraweirdtriedclackcolorroughweighuncutladlestripcraftminusdiceytitanlucidvicardressditchgypsypastataffyflameswoopaloofsightbroketearychartsixtywordysheerlepernoseybulgesavorclampfunkyfoamytoxicbrandplumbdingybuttedrilltripebiceptenorkrillworsedramahyenathinkratiocobrabasilscrumbusedphonecourtcamelproofheardangelpetalpoutythrobmaybefetalsprigspineshoutcadetmacrododgysatyrrarerbingetrendnuttyleaptamisssplitmyrrhwidthsonartowerbaronfeverwaversparkbeliesloopexpelsmotebalerabovenorthwaferscantfrillawashsnackscowlfraildriftlimbofencemotelouncewreakreveltalonpriorkneltcelloflakedebuganodecrimesalvescoutimbuepinkystavevaguechockfightvideostoneteachcleftfrostprawnbootytwistapneastiffplazaledgetweakboardgrantmedicbaconcablebrawlslunkraspyforumdronewomenmucusboasttoddycoventumortruerwrathstallsteamaxialpurerdailytrailnichemealyjuicenylonplumpmerryflailpapalwheatberrycowererectbruteleggysnipesinewskierpennyjumpyrallyumbrascarymodemgrossaviangreedsatintonicparkasnifflividstarktrumpgiddyreusetabooavoidquotedevillikenglossgayerberetnoiseglanddealtslingrumoroperathightongaflarewoundwhitebulkyetudehorsecircapaddyinboxfizzygrainexertsurgegleambellesalvocrushfruitsappytakertractovinespikyfrankreedyfilthspasmheavemamborightclanktrustlumenbornespooksauceamberlathecaratcorerdirtyslylyaffixalloytaintsheepkinkywoolymauveflungyachtfriedquailbruntgrimycurvycageyrinsedeucestategraspmilkybisongraftsandybasteflaskhedgegirlyswashboneycoupeendowabhorwelchbladetightgeesemisermirthcloudcaballeechclosetenthpecandroitgrailcloneguiseralphtangobiddysmithmowerpayeeserifdrapefifthspankglazeallottruckkayakvirustestytepeefullyzonalmetrocurrygrandbanjoaxionbezeloccurchainnasalgooeyfilerbraceallaypubicravenpleadgnashflakymunchdullyekingthingslinkhurrytheftshornpygmyranchwringlemonshoremammafrozenewerstylemooseanticdrownveganchessguppyunionleverlorryimagecabbydruidexacttruthdopeyspearcriedchimecronystunktimidbatchgaugerotorcrackcurvelattewitchbunchrepelanvilsoapymeterbrothmadlydriedsceneknownmagmaroostwomanthongpunchpastydownykneadwhirlrapidclangangerdrivegoofyemailmusicstuffbleepridermeccafoliosetupversoquashfaunagummyhappynewlyfussyrelicguavarattyfudgefemurchirpfortealibiwhinepettygollyplaitfleckfelongourdbrownthrumficusstashdecrywiserjuntavisordauntscreeimpelawaitpresswhoseturbostoopspeakmangyeyinginletcronepulsemossystaidhencepinchteddysullysnoreripensnowyatticgoingleachmouthhoundclumptonalbigotperilpieceblamehautespiedundidintrobasalrodeoguardsteerloamyscampscrammanlyhellovauntorganferalknockextracondoadaptwillypolkarayonskirtfaithtorsomatchmercytepidsleekrisertwixtpeaceflushcattyloginejectrogerrivaluntierefitaortaadultjudgerowerartsyruralshavebobbyeclatfellagailyharryhastyhydroliegeoctalombrepayersoothunsetunlitvomitfannyfetusbutchstalkflackwidowaugur'
@@ -0,0 +1,18 @@
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize("wordleaid_ext.pyx", language_level=3)
+except ImportError:
+    # The extension is an optional accelerator; the pure-Python module
+    # works without it
+    ext_modules = []
+
+setup(
+    name="wordleaid",
+    py_modules=["wordleaid", "accepted_words_data"],
+    ext_modules=ext_modules,
+    install_requires=["numpy"],
+    extras_require={"accel": ["numba", "Cython"]},
+)
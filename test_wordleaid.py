@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+import wordleaid
+from wordleaid import WordleAid
+
+# Fixed games exercising greens, yellows, blacks, and duplicate letters
+# (NARRE vs ROKOS: a yellow and a black for the same repeated letter)
+GAMES = [
+    ("slosh", ["crane", "slimy", "shunt"]),
+    ("rokos", ["narre", "becap"]),
+    ("tiger", ["eerie", "aalii"]),
+]
+
+
+@pytest.fixture(scope="module")
+def aid():
+    return WordleAid(output_style="alpha")
+
+
+@pytest.fixture(params=["cython", "numba", "numpy"])
+def backend(request, monkeypatch):
+    """Force one of the three kernel implementations for the test."""
+    if request.param == "cython" and not wordleaid.CYTHON_EXT_AVAILABLE:
+        pytest.skip("wordleaid_ext is not built")
+    if request.param == "numba" and not wordleaid.NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+    monkeypatch.setattr(
+        wordleaid, "CYTHON_EXT_AVAILABLE", request.param == "cython"
+    )
+    monkeypatch.setattr(wordleaid, "NUMBA_AVAILABLE", request.param == "numba")
+    return request.param
+
+
+def test_slosh_vs_shunt_duplicate_letter_semantics():
+    # The repeated S in SLOSH: one copy is green in place, the other must
+    # not turn yellow once the answer's only S is spoken for
+    wa = WordleAid(output_style="blocks", default_word_list=False)
+    assert wa.compare_words("SLOSH", "SHUNT") == "🟩⬛⬛⬛🟨"
+
+    wa = WordleAid(output_style="alpha", default_word_list=False)
+    assert wa.compare_words("SLOSH", "SHUNT") == "Y___?"
+
+
+def test_repeated_guess_letter_consumes_one_occurrence():
+    wa = WordleAid(output_style="alpha", default_word_list=False)
+    # TIGER has a single E, so only the first E of EERIE goes yellow
+    assert wa.compare_words("EERIE", "TIGER") == "?_??_"
+    assert wa.compare_words("crane", "crane") == "YYYYY"
+
+
+def test_compare_words_rejects_wrong_length():
+    wa = WordleAid(output_style="alpha", default_word_list=False)
+    with pytest.raises(ValueError):
+        wa.compare_words("four", "crane")
+
+
+def test_compare_words_rejects_non_ascii():
+    # Multi-byte characters would be compared byte-by-byte out of alignment
+    wa = WordleAid(output_style="alpha", default_word_list=False)
+    with pytest.raises(ValueError):
+        wa.compare_words("éclat", "table")
+    with pytest.raises(ValueError):
+        wa.compare_words("naïve", "ouïja")
+
+
+def test_find_candidates_backend_equivalence(aid, backend):
+    # Every backend must return exactly the words whose compare_words
+    # pattern reproduces each clue
+    words = aid.accepted_words
+    for answer, guesses in GAMES:
+        ki = [(g, aid.compare_words(g, answer)) for g in guesses]
+        expected = [
+            w for w in words
+            if all(aid.compare_words(g, w) == ts for g, ts in ki)
+        ]
+        aid._prefix_cache.clear()
+        got = aid.find_candidates(ki)
+        assert got == expected
+        assert answer in got
+        # custom wordlists take the uncached path
+        sub = words[:300] + [answer]
+        assert aid.find_candidates(ki, wordlist=sub) == [
+            w for w in sub
+            if all(aid.compare_words(g, w) == ts for g, ts in ki)
+        ]
+
+
+def test_compare_words_batch_backend_equivalence(aid, backend):
+    sub = aid.accepted_words[::250]
+    arr = aid._encode_wordlist(sub)
+    for guess in ("crane", "slosh", "eerie"):
+        codes = aid.compare_words_batch(guess, arr)
+        assert codes.dtype == np.uint8
+        assert codes.tolist() == [
+            aid.pattern_code(aid.compare_words(guess, w)) for w in sub
+        ]
+
+
+def test_precompute_patterns_backend_equivalence(aid, backend):
+    answers = aid.accepted_words[::500]
+    aid.precompute_patterns(answers=answers)
+    words = aid.accepted_words
+    for gi in (0, 4321, len(words) - 1):
+        for ai in (0, 7, len(answers) - 1):
+            assert aid.patterns[gi, ai] == aid.pattern_code(
+                aid.compare_words(words[gi], answers[ai])
+            )
+
+
+def test_find_candidates_rejects_non_ascii_words():
+    # Same ASCII contract as compare_words, for both clue guesses and
+    # custom wordlists
+    wa = WordleAid(output_style="alpha")
+    with pytest.raises(ValueError):
+        wa.find_candidates([("éclat", "_____")])
+    with pytest.raises(ValueError):
+        wa.find_candidates([("crane", "_____")], wordlist=["naïve"])
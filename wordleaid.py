@@ -1,3 +1,145 @@
+import mmap
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    from numba import set_num_threads as _numba_set_num_threads
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def set_num_threads(n):
+    """Set the number of threads used by the parallel numba kernels.
+
+    A no-op when numba is unavailable."""
+    if NUMBA_AVAILABLE:
+        _numba_set_num_threads(n)
+
+try:
+    import wordleaid_ext
+
+    CYTHON_EXT_AVAILABLE = True
+except ImportError:
+    CYTHON_EXT_AVAILABLE = False
+
+try:
+    from accepted_words_data import WORDS_BLOB as _WORDS_BLOB
+except ImportError:
+    _WORDS_BLOB = None
+
+
+def _pattern_code(guess, answer):
+    """Compare two 5-byte words and return the tile pattern as a base-3
+    integer 0..242 (trits are 0=black, 1=yellow, 2=green, position 0 in the
+    least significant trit). Duplicate letters are handled by marking each
+    answer position as "used" once it has paid for a green or yellow tile.
+    """
+    used = 0
+    for i in range(5):
+        if guess[i] == answer[i]:
+            used |= 1 << i
+    code = 0
+    p = 1
+    for i in range(5):
+        t = 0
+        if guess[i] == answer[i]:
+            t = 2
+        else:
+            for j in range(5):
+                if (used >> j) & 1 == 0 and answer[j] == guess[i]:
+                    used |= 1 << j
+                    t = 1
+                    break
+        code += t * p
+        p *= 3
+    return code
+
+
+if NUMBA_AVAILABLE:
+    # Explicit signatures compile the kernels eagerly at import, so the
+    # first query doesn't pay the JIT cost. The input arrays are declared
+    # read-only because the word matrix may be backed by a bytes literal
+    # or a read-only memmap; writable arrays still coerce fine.
+    from numba import types as _nbt
+
+    _U8_1D_RO = _nbt.Array(_nbt.uint8, 1, "C", readonly=True)
+    _U8_2D_RO = _nbt.Array(_nbt.uint8, 2, "C", readonly=True)
+
+    _pattern_code = njit(_nbt.uint8(_U8_1D_RO, _U8_1D_RO), cache=True)(
+        _pattern_code
+    )
+
+    @njit(_nbt.uint8[:, ::1](_U8_2D_RO, _U8_2D_RO), parallel=True, cache=True)
+    def _pattern_matrix(guesses, answers):
+        """Tile-pattern codes for every (guess, answer) pair of two uint8
+        word matrices, as a (Nguess, Nanswer) uint8 array."""
+        out = np.empty((guesses.shape[0], answers.shape[0]), dtype=np.uint8)
+        for gi in prange(guesses.shape[0]):
+            for ai in range(answers.shape[0]):
+                out[gi, ai] = _pattern_code(guesses[gi], answers[ai])
+        return out
+
+    @njit(
+        _nbt.void(
+            _U8_2D_RO,
+            _U8_1D_RO,
+            _U8_1D_RO,
+            _U8_1D_RO,
+            _U8_1D_RO,
+            _U8_1D_RO,
+            _nbt.uint8[::1],
+        ),
+        parallel=True,
+        cache=True,
+    )
+    def _filter_clue(words, guess, codes, letters, req, capped, mask):
+        """Apply one (guess, tile-codes) clue to the word matrix in place.
+
+        Walks the words in a tight compiled loop (parallel across words --
+        each iteration only touches its own mask byte), short-circuiting on
+        the first disqualifying position, and writes the surviving words
+        back into `mask`. Tile codes are 0=black, 1=yellow, 2=green;
+        anything else is ignored. `letters`/`req`/`capped` carry the
+        per-letter occurrence counts required by the clue (see
+        find_candidates).
+        """
+        n = words.shape[0]
+        for w in prange(n):
+            if not mask[w]:
+                continue
+            ok = True
+            for i in range(5):
+                c = codes[i]
+                if c == 2:
+                    if words[w, i] != guess[i]:
+                        ok = False
+                        break
+                elif c <= 1:
+                    if words[w, i] == guess[i]:
+                        ok = False
+                        break
+            if ok:
+                for j in range(letters.shape[0]):
+                    g = letters[j]
+                    cnt = 0
+                    for i in range(5):
+                        if words[w, i] == g:
+                            cnt += 1
+                    if capped[j]:
+                        if cnt != req[j]:
+                            ok = False
+                            break
+                    elif cnt < req[j]:
+                        ok = False
+                        break
+            mask[w] = ok
+
+
 class WordleAid:
     """
     Functions to help solve the Wordle puzzle, without solving it for you.
@@ -12,6 +154,9 @@ class WordleAid:
         True (the default) will load the built-in list of accepted Wordle words
     """
 
+    # Most prefix-cache entries kept for incremental find_candidates calls
+    _PREFIX_CACHE_SIZE = 128
+
     def __init__(self, output_style="blocks", default_word_list=True):
         output_style = output_style.lower()
         if output_style not in ["alpha", "blocks"]:
@@ -30,12 +175,122 @@ class WordleAid:
             self.M_DISPLAY = "?"
             self.N_DISPLAY = "_"
 
+        # Display strings for all 3^5 = 243 possible tile patterns, indexed
+        # by base-3 pattern code, so building a tilestring is a single list
+        # lookup instead of five string concatenations
+        displays = (self.N_DISPLAY, self.M_DISPLAY, self.Y_DISPLAY)
+        self._pattern_display = [
+            "".join(displays[code // 3**i % 3] for i in range(5))
+            for code in range(243)
+        ]
+
+        # Translation table mapping every recognized tile character to its
+        # tile code (0=black, 1=yellow, 2=green), so tilestrings are decoded
+        # once instead of re-testing `tile in self.YES/...` per position
+        self._tile_trans = str.maketrans(
+            {ch: code for chars, code in
+             ((self.YES, 2), (self.MAYBE, 1), (self.NO, 0)) for ch in chars}
+        )
+
+        self._prefix_cache = OrderedDict()
+
         if default_word_list:
             self.load_word_list()
 
     def load_word_list(self, f="accepted_words.txt"):
-        with open("accepted_words.txt") as f:
-            self.accepted_words = f.read().splitlines()
+        """
+        Load the word list from `f`, preferring a compiled binary sibling.
+
+        When loading the default list, the compiled `accepted_words_data`
+        module (written by `compile_word_list_module`) is used if it is
+        importable: its bytes literal becomes the uint8 word matrix with no
+        file access or parsing at all. Otherwise, if a `.bin` file produced
+        by `compile_word_list` exists next to `f`, it is memory-mapped
+        directly into the matrix (the decoded string list is materialized
+        lazily on first use). Failing both, the text file is mapped and
+        split on newlines.
+        """
+        self._prefix_cache = OrderedDict()
+        bin_path = os.path.splitext(f)[0] + ".bin"
+        if f == "accepted_words.txt" and _WORDS_BLOB is not None:
+            self.accepted_words_arr = np.frombuffer(
+                _WORDS_BLOB, dtype=np.uint8
+            ).reshape(-1, 5)
+            self._accepted_words = None
+        elif os.path.exists(bin_path):
+            self.accepted_words_arr = np.memmap(
+                bin_path, dtype=np.uint8, mode="r"
+            ).reshape(-1, 5)
+            self._accepted_words = None
+        else:
+            with open(f, "rb") as fh:
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    lines = bytes(mm).split(b"\n")
+            self._accepted_words = [ln.decode() for ln in lines if ln]
+            self.accepted_words_arr = self._encode_wordlist(self._accepted_words)
+        self.word_masks = self._letter_masks(self.accepted_words_arr)
+
+    @property
+    def accepted_words(self):
+        if self._accepted_words is None:
+            blob = self.accepted_words_arr.tobytes().decode()
+            self._accepted_words = [blob[i : i + 5] for i in range(0, len(blob), 5)]
+        return self._accepted_words
+
+    def compile_word_list(self, path="accepted_words.bin"):
+        """
+        Write the loaded word list as a contiguous 5-byte-per-word binary
+        blob that `load_word_list` can memory-map with no parsing.
+        """
+        with open(path, "wb") as fh:
+            fh.write(self.accepted_words_arr.tobytes())
+
+    def compile_word_list_module(self, path="accepted_words_data.py"):
+        """
+        Write the loaded word list as an importable Python module holding a
+        single bytes literal, so instantiation parses no files at all.
+        """
+        blob = self.accepted_words_arr.tobytes()
+        with open(path, "w") as fh:
+            fh.write(
+                '"""The accepted word list compiled to one contiguous\n'
+                "5-byte-per-word blob.\n\n"
+                "Generated by WordleAid.compile_word_list_module from\n"
+                'accepted_words.txt; regenerate rather than editing."""\n'
+                "\n"
+                f"WORDS_BLOB = {blob!r}\n"
+            )
+
+    @staticmethod
+    def _encode_wordlist(wordlist):
+        """Pack a list of 5-letter words into a (N, 5) uint8 array.
+
+        Words must be 5 ASCII characters so that each occupies exactly 5
+        bytes of the packed matrix; anything else would be compared out of
+        alignment, so it is rejected here.
+        """
+        for w in wordlist:
+            if len(w) != 5 or not w.isascii():
+                raise ValueError(f"Words must be 5 ASCII characters. Received '{w}.'")
+        return np.frombuffer("".join(wordlist).encode(), dtype=np.uint8).reshape(-1, 5)
+
+    def _encode_tiles(self, tilestring):
+        """Decode a display tilestring into 5 tile-code bytes (0=black,
+        1=yellow, 2=green); unrecognized characters become 3."""
+        translated = tilestring.translate(self._tile_trans)
+        return bytes(min(ord(c), 3) for c in translated)
+
+    @staticmethod
+    def _letter_masks(arr):
+        """Build a uint32 letter-presence bitmask per word: bit (c - 97) is
+        set if the word contains letter c. Makes "letter in word" a single
+        shift-and-AND instead of a scan across the word."""
+        masks = np.zeros(arr.shape[0], dtype=np.uint32)
+        for i in range(5):
+            col = arr[:, i].astype(np.uint32)
+            bit = np.uint32(1) << ((col - 97) & np.uint32(31))
+            masks |= np.where((col >= 97) & (col <= 122), bit, np.uint32(0))
+        return masks
 
     def compare_words(self, guess, wordle):
         """
@@ -69,17 +324,82 @@ class WordleAid:
                 f"`guess` and `wordle` must both be 5-character strings. Received '{guess}' and '{wordle}.'"
             )
 
-        tiles = ""
-        pairs = list(zip(wordle, guess))
-        for w, g in pairs:
-            if w == g:
-                tiles += self.Y_DISPLAY
-            elif [p for p in pairs if p[0] == g and p[1] != g]:
-                tiles += self.M_DISPLAY
-            else:
-                tiles += self.N_DISPLAY
+        gb = guess.encode()
+        wb = wordle.encode()
+        # The comparison works on single bytes, so characters that encode to
+        # more than one byte (anything non-ASCII) would be compared out of
+        # alignment; reject them rather than return a wrong tilestring
+        if len(gb) != 5 or len(wb) != 5:
+            raise ValueError(
+                f"`guess` and `wordle` must both be 5 ASCII characters. Received '{guess}' and '{wordle}.'"
+            )
+
+        # Canonical two-pass comparison. Pass 1 counts each wordle letter
+        # that is not an exact (green) match; pass 2 marks a tile yellow iff
+        # its letter still has a nonzero count, consuming one occurrence.
+        # The counts make duplicate letters behave correctly: a repeated
+        # guess letter only stays yellow while unmatched occurrences remain.
+        counts = bytearray(256)
+        for i in range(5):
+            if wb[i] != gb[i]:
+                counts[wb[i]] += 1
+
+        code = 0
+        p = 1
+        for i in range(5):
+            g = gb[i]
+            if wb[i] == g:
+                code += 2 * p
+            elif counts[g] > 0:
+                counts[g] -= 1
+                code += p
+            p *= 3
+
+        return self._pattern_display[code]
 
-        return tiles
+    def compare_words_batch(self, guess, answers_u8=None):
+        """
+        Compare one guess against many answers at once.
+
+        The vectorized counterpart of calling `compare_words` in a loop:
+        returns the base-3 pattern code (see `pattern_code`) of `guess`
+        against every answer. Solver code scoring a guess against all
+        remaining candidates (entropy, minimax, ...) should call this; it
+        is also what `precompute_patterns` uses row by row.
+
+        Parameters
+        ----------
+        guess : str
+            The guessed word.
+        answers_u8 : numpy.ndarray of uint8, shape (N, 5)
+            The answers to compare against, as packed by `_encode_wordlist`.
+            By default the full accepted word matrix is used.
+
+        Returns
+        -------
+        numpy.ndarray of uint8, shape (N,)
+            The pattern code of `guess` against each answer.
+        """
+
+        if len(guess) != 5:
+            raise ValueError(
+                f"`guess` must be a 5-character string. Received '{guess}.'"
+            )
+        if answers_u8 is None:
+            answers_u8 = self.accepted_words_arr
+
+        guesses = self._encode_wordlist([guess])
+        if CYTHON_EXT_AVAILABLE:
+            out = np.empty((1, answers_u8.shape[0]), dtype=np.uint8)
+            wordleaid_ext.pattern_matrix(guesses, answers_u8, out)
+            return out[0]
+        if NUMBA_AVAILABLE:
+            return _pattern_matrix(guesses, answers_u8)[0]
+        g = guesses[0]
+        out = np.empty(answers_u8.shape[0], dtype=np.uint8)
+        for ai in range(answers_u8.shape[0]):
+            out[ai] = _pattern_code(g, answers_u8[ai])
+        return out
 
     def find_candidates(self, known_info, wordlist=None):
         """
@@ -105,57 +425,248 @@ class WordleAid:
 
         if wordlist is None:
             wordlist = self.accepted_words
+            arr = self.accepted_words_arr
+            word_masks = self.word_masks
+            cache = self._prefix_cache
+        else:
+            arr = self._encode_wordlist(wordlist)
+            word_masks = self._letter_masks(arr)
+            cache = None
 
         for i in known_info:
             wd, ts = i
-            if len(wd) !=5 or len(ts) !=5:
-                raise ValueError(f"The known info list can only contain 5 character strings. Received {i}.")
-
-        # Get a list of all the green letters that have been found so far so that
-        # we can do a proper check of black tiles. A black tile could mean either
-        # a) that letter does not exist in the word b) it does, but in a different
-        # (green) square
-        green_letters = [None] * 5
+            if len(wd) != 5 or not wd.isascii() or len(ts) != 5:
+                raise ValueError(f"The known info list can only contain 5-character ASCII words and 5-tile strings. Received {i}.")
+
+        # Encode each clue once. Positional rules: a 🟩 letter must be in its
+        # position, and a 🟨/⬛ letter must not be (⬛ in a matching position
+        # would have shown 🟩). Letter counts are tallied per clue: each
+        # 🟩/🟨 tile of a letter means one occurrence of it in the word, and
+        # a ⬛ tile means there are no occurrences beyond those. This handles
+        # repeated guess letters, where one copy can be 🟨 while another is
+        # ⬛ even though the letter is in the word.
+        clues = []
         for guessed_word, tilestring in known_info:
-            for i, (l, tile) in enumerate(zip(guessed_word, tilestring)):
-                if tile in self.YES:
-                    green_letters[i] = l
-
-        candidates = []
-        # Loop through the words we want to compare to the known info
-        for word in wordlist:
-            qualified = True
-            # Loop through the known info
-            for guessed_word, tilestring in known_info:
-                # Loop through the letter positions in this word/tilestring
-                for i, tile in enumerate(tilestring):
-                    # Candidate doesn't have a 🟩 letter in the proper position
-                    if tile in self.YES and word[i] != guessed_word[i]:
-                        qualified = False
-                        break
-                    # Candidate contains a ⬛ letter, unless it's also a 🟩 letter in the right spot
-                    elif (
-                        tile in self.NO
-                        and guessed_word[i] in word
-                        and not (
-                            guessed_word[i] in green_letters
-                            and word[green_letters.index(guessed_word[i])]
-                            == guessed_word[i]
-                            and not word[i] == guessed_word[i]
-                        )
-                    ):
-                        qualified = False
-                        break
-                    # Candidate does not contain a 🟨 letter, or it's in the same (wrong) spot
-                    elif tile in self.MAYBE and (
-                        guessed_word[i] not in word or guessed_word[i] == word[i]
-                    ):
-                        qualified = False
-                        break
-                # If this word has been disqualified, we can break out of the loop
-                if not qualified:
-                    break
-            if qualified:
-                candidates.append(word)
+            gw = guessed_word.encode()
+            tile_codes = self._encode_tiles(tilestring)
+            codes = np.frombuffer(tile_codes, dtype=np.uint8)
+            need = {}
+            capped = set()
+            for i in range(5):
+                g = gw[i]
+                c = tile_codes[i]
+                if c >= 3:
+                    continue
+                if c:
+                    need[g] = need.get(g, 0) + 1
+                else:
+                    need.setdefault(g, 0)
+                    capped.add(g)
+            clues.append((gw, tile_codes, codes, need, capped))
+
+        # Apply the most selective clues first (greens score 2, yellows 1):
+        # they eliminate more words up front, so later clues scan fewer
+        # rows. The constraints are independent, so order doesn't change
+        # the result
+        keyed = sorted(
+            ((sum(c for c in clue[1] if c <= 2), (clue[0], clue[1]), clue)
+             for clue in clues),
+            key=lambda kc: kc[0],
+            reverse=True,
+        )
+
+        # Resume from the largest already-cached subset of these clues:
+        # interactive games and tree search grow known_info one clue at a
+        # time, so the surviving indices for the earlier clues are usually
+        # cached from the previous call. Keys are frozensets of encoded
+        # clues, so the cache is indifferent to both the caller's clue
+        # order and the selectivity sort
+        idx = None
+        done = frozenset()
+        if cache is not None:
+            all_keys = frozenset(key for _, key, _ in keyed)
+            for cached in cache:
+                if len(cached) > len(done) and cached <= all_keys:
+                    done = cached
+            if done:
+                idx = cache[done]
+                cache.move_to_end(done)
+
+        for _, key, clue in keyed:
+            if key in done:
+                continue
+            gw, tile_codes, codes, need, capped = clue
+            if idx is None:
+                keep = self._apply_clue(arr, word_masks, gw, codes, need, capped)
+                idx = np.flatnonzero(keep)
+            else:
+                keep = self._apply_clue(
+                    arr[idx], word_masks[idx], gw, codes, need, capped
+                )
+                idx = idx[keep]
+            done = done | {key}
+            if cache is not None:
+                cache[done] = idx
+                while len(cache) > self._PREFIX_CACHE_SIZE:
+                    cache.popitem(last=False)
+
+        if idx is None:
+            return list(wordlist)
+        return [wordlist[i] for i in idx]
+
+    def _apply_clue(self, arr, word_masks, gw, codes, need, capped):
+        """Apply one encoded clue to a word matrix and return a bool array
+        marking the words that survive it."""
+        if CYTHON_EXT_AVAILABLE or NUMBA_AVAILABLE:
+            # Compiled path: one tight loop over the word matrix,
+            # short-circuiting per word, with no per-rule temporaries
+            kernel = (
+                wordleaid_ext.filter_clue if CYTHON_EXT_AVAILABLE else _filter_clue
+            )
+            guess = np.frombuffer(gw, dtype=np.uint8)
+            letters = np.fromiter(need, dtype=np.uint8, count=len(need))
+            req = np.fromiter(need.values(), dtype=np.uint8, count=len(need))
+            cap = np.fromiter(
+                (g in capped for g in need), dtype=np.uint8, count=len(need)
+            )
+            mask = np.ones(arr.shape[0], dtype=np.uint8)
+            kernel(arr, guess, codes, letters, req, cap, mask)
+            return mask.view(np.bool_)
+
+        guess = np.frombuffer(gw, dtype=np.uint8, count=5)
+        # All positional rules fused into one branchless (N,5) expression:
+        # a word is disqualified if a green position doesn't match the
+        # guess letter or a yellow/black one does
+        eq = arr == guess
+        violation = ((codes == 2) & ~eq) | ((codes <= 1) & eq)
+        mask = ~violation.any(axis=1)
+        # All fully-black letters of the clue collapse into a single
+        # "contains none of these" bitmask test at the end
+        absent = np.uint32(0)
+        for g, k in need.items():
+            if 97 <= g <= 122:
+                bit = np.uint32(1 << (g - 97))
+                present = (word_masks & bit) != 0
+            else:
+                bit = None
+                present = (arr == g).any(axis=1)
+            if g in capped:
+                if k == 0:
+                    if bit is not None:
+                        absent |= bit
+                    else:
+                        mask &= ~present
+                else:
+                    mask &= (arr == g).sum(axis=1) == k
+            elif k == 1:
+                mask &= present
+            else:
+                mask &= (arr == g).sum(axis=1) >= k
+        if absent:
+            mask &= (word_masks & absent) == 0
+        return mask
+
+    def pattern_code(self, tilestring):
+        """
+        Encode a tilestring as its base-3 integer pattern code.
+
+        Each tile is a trit (0=black, 1=yellow, 2=green) with position 0 in
+        the least significant place, so the 3^5 = 243 possible tilestrings
+        map to the integers 0..242.
+
+        Parameters
+        ----------
+        tilestring : str
+            A 5-tile string in any of the recognized tile characters.
+
+        Returns
+        -------
+        int
+            The pattern code, 0..242.
+        """
+
+        code = 0
+        p = 1
+        for i, c in enumerate(self._encode_tiles(tilestring)):
+            if c >= 3:
+                raise ValueError(
+                    f"Unrecognized tile character '{tilestring[i]}'."
+                )
+            code += c * p
+            p *= 3
+        return code
+
+    def precompute_patterns(self, answers=None):
+        """
+        Precompute the tile pattern of every guess against every answer.
+
+        Builds `self.patterns`, a uint8 array of shape (Nguess, Nanswer)
+        where cell (g, a) holds the base-3 pattern code (see `pattern_code`)
+        of guessing word g against answer a. Solvers that repeatedly score
+        guesses can then look patterns up instead of recomputing them, and
+        `find_candidates_fast` filters candidates with a single vectorized
+        row comparison per clue.
+
+        Parameters
+        ----------
+        answers : list of str
+            The candidate answers to precompute against. By default the full
+            accepted word list is used; note that costs ~N^2 bytes of memory
+            (~220MB for the built-in list).
+        """
+
+        guesses_arr = self.accepted_words_arr
+        if answers is None:
+            answers = self.accepted_words
+            answers_arr = guesses_arr
+        else:
+            answers_arr = self._encode_wordlist(answers)
+
+        if CYTHON_EXT_AVAILABLE:
+            self.patterns = np.empty(
+                (guesses_arr.shape[0], answers_arr.shape[0]), dtype=np.uint8
+            )
+            wordleaid_ext.pattern_matrix(guesses_arr, answers_arr, self.patterns)
+        elif NUMBA_AVAILABLE:
+            self.patterns = _pattern_matrix(guesses_arr, answers_arr)
+        else:
+            self.patterns = np.empty(
+                (guesses_arr.shape[0], answers_arr.shape[0]), dtype=np.uint8
+            )
+            for gi in range(guesses_arr.shape[0]):
+                g = guesses_arr[gi]
+                for ai in range(answers_arr.shape[0]):
+                    self.patterns[gi, ai] = _pattern_code(g, answers_arr[ai])
+        self.pattern_answers = list(answers)
+        self.word_index = {w: i for i, w in enumerate(self.accepted_words)}
+
+    def find_candidates_fast(self, known_info):
+        """
+        Find eligible words using the precomputed pattern table.
+
+        Equivalent to `find_candidates` over the answers passed to
+        `precompute_patterns`, but each clue is applied as one vectorized
+        equality test against a row of the pattern table.
+
+        Parameters
+        ----------
+        known_info : list of tuples
+            A list of (guess, result) pairs, where guess is a word from the
+            accepted list (or its index) and result is a tilestring (or its
+            pattern code).
+
+        Returns
+        -------
+        list
+            The answers that satisfy every provided comparison.
+        """
+
+        mask = np.ones(self.patterns.shape[1], dtype=bool)
+        for guess, observed in known_info:
+            if not isinstance(guess, (int, np.integer)):
+                guess = self.word_index[guess]
+            if not isinstance(observed, (int, np.integer)):
+                observed = self.pattern_code(observed)
+            mask &= self.patterns[guess] == observed
 
-        return candidates
+        return [self.pattern_answers[i] for i in np.flatnonzero(mask)]
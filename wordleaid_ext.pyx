@@ -0,0 +1,119 @@
+# cython: language_level=3
+"""Compiled kernels for WordleAid.
+
+Mirrors the numba kernels in wordleaid.py: the Python class encodes words
+and clues into uint8 arrays and calls in here for the hot loops. Build with
+`python setup.py build_ext --inplace`.
+"""
+
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline unsigned char pattern_code_pair(
+    const unsigned char[:] guess, const unsigned char[:] answer
+) nogil:
+    """Tile pattern of one (guess, answer) pair as a base-3 code 0..242
+    (trits are 0=black, 1=yellow, 2=green, position 0 least significant)."""
+    cdef int used = 0
+    cdef unsigned char code = 0
+    cdef unsigned char p = 1
+    cdef unsigned char t
+    cdef Py_ssize_t i, j
+    for i in range(5):
+        if guess[i] == answer[i]:
+            used |= 1 << i
+    for i in range(5):
+        t = 0
+        if guess[i] == answer[i]:
+            t = 2
+        else:
+            for j in range(5):
+                if not (used >> j) & 1 and answer[j] == guess[i]:
+                    used |= 1 << j
+                    t = 1
+                    break
+        code += t * p
+        p *= 3
+    return code
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef unsigned char pattern_code(
+    const unsigned char[::1] guess, const unsigned char[::1] answer
+):
+    """Python-callable wrapper around `pattern_code_pair`."""
+    return pattern_code_pair(guess, answer)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef pattern_matrix(
+    const unsigned char[:, ::1] guesses,
+    const unsigned char[:, ::1] answers,
+    unsigned char[:, ::1] out,
+):
+    """Fill `out` with the pattern code of every (guess, answer) pair."""
+    cdef Py_ssize_t gi, ai
+    with nogil:
+        for gi in range(guesses.shape[0]):
+            for ai in range(answers.shape[0]):
+                out[gi, ai] = pattern_code_pair(guesses[gi], answers[ai])
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef filter_clue(
+    const unsigned char[:, ::1] words,
+    const unsigned char[::1] guess,
+    const unsigned char[::1] codes,
+    const unsigned char[::1] letters,
+    const unsigned char[::1] req,
+    const unsigned char[::1] capped,
+    unsigned char[::1] mask,
+):
+    """Apply one (guess, tile-codes) clue to the word matrix in place.
+
+    Same contract as the numba kernel: tile codes are 0=black, 1=yellow,
+    2=green (anything else ignored), `letters`/`req`/`capped` carry the
+    per-letter occurrence counts required by the clue, and surviving words
+    are written back into `mask`.
+    """
+    cdef Py_ssize_t n = words.shape[0]
+    cdef Py_ssize_t nletters = letters.shape[0]
+    cdef Py_ssize_t w, i, j
+    cdef unsigned char c, g
+    cdef int cnt
+    cdef bint ok
+    with nogil:
+        for w in range(n):
+            if not mask[w]:
+                continue
+            ok = True
+            for i in range(5):
+                c = codes[i]
+                if c == 2:
+                    if words[w, i] != guess[i]:
+                        ok = False
+                        break
+                elif c <= 1:
+                    if words[w, i] == guess[i]:
+                        ok = False
+                        break
+            if ok:
+                for j in range(nletters):
+                    g = letters[j]
+                    cnt = 0
+                    for i in range(5):
+                        if words[w, i] == g:
+                            cnt += 1
+                    if capped[j]:
+                        if cnt != req[j]:
+                            ok = False
+                            break
+                    elif cnt < req[j]:
+                        ok = False
+                        break
+            mask[w] = ok